@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Synthetic Data Generators
+Large, deterministic fixtures for benchmarking the OpenClaw tools
+**Created**: 2026-10-19
+
+    productivity_history  ~/.openclaw/productivity.json-shaped session history
+    broadcast_history     /tmp/community_broadcasts.json-shaped history (records: broadcast_records)
+    lead_history          /tmp/lead_generation.json-shaped history (records: lead_records)
+    workspace_tree        brands/ + projects/ tree with files and git repos
+    template_tree         create-next-app-shaped project (sources + a large node_modules)
+"""
+
+import datetime
+import json
+import os
+import random
+import subprocess
+from pathlib import Path
+
+PROJECTS = ["livre-magique", "storyverse-hub", "trend-habit-tracker", "furniture-showroom",
+            "senin-hekayen-az", "moltbook-enhancements", "openclaw-tools"]
+TASK_TYPES = ["development", "content", "research", "marketing", "deployment"]
+ENDPOINTS = ["OpenClaw Main Community", "French Community Chat", "Moltbook Community", "Community Discord"]
+SOURCES = ["OpenClaw French Community", "Moltbook French Parents", "French Community Discord",
+           "OpenClaw Main Community"]
+STATUSES = ["delivered", "failed", "timeout", "community_unreachable"]
+LEAD_STATUSES = ["lead_submitted", "timeout", "source_unreachable"]
+
+
+def _timestamps(count: int, rng: random.Random, days: int = 730):
+    now = datetime.datetime(2026, 10, 1)
+    start = now - datetime.timedelta(days=days)
+    step = (now - start) / max(count, 1)
+    for i in range(count):
+        yield start + step * i + datetime.timedelta(minutes=rng.randint(0, 30))
+
+
+def productivity_history(path: Path, sessions: int = 50_000, seed: int = 1) -> Path:
+    rng = random.Random(seed)
+    records = []
+    for start in _timestamps(sessions, rng):
+        hours = round(rng.uniform(0.25, 4.0), 2)
+        records.append({
+            "start": start.isoformat(),
+            "project": rng.choice(PROJECTS),
+            "type": rng.choice(TASK_TYPES),
+            "status": "completed",
+            "end": (start + datetime.timedelta(hours=hours)).isoformat(),
+            "notes": "synthetic session",
+            "duration_hours": hours
+        })
+    _write_json(path, {"sessions": records, "tasks": [], "goals": {}})
+    return path
+
+
+def _endpoint_results(rng: random.Random, names: list, key: str) -> list:
+    results = []
+    for name in names:
+        status = rng.choice(STATUSES)
+        results.append({
+            key: name,
+            "status": status,
+            "real_communication": status == "delivered",
+            "fake_logging": status == "community_unreachable",
+            "delivery_time": round(rng.uniform(0.05, 1.5), 3)
+        })
+    return results
+
+
+def _source_results(rng: random.Random) -> list:
+    results = []
+    for name in SOURCES:
+        status = rng.choice(LEAD_STATUSES)
+        result = {"source": name, "status": status, "lead_type": rng.choice(["french_community", "french_parents"])}
+        if status == "lead_submitted":
+            result.update(response_code=200, lead_quality=rng.choice(["high", "medium"]), real_lead=True,
+                          is_fake=False, response_time=round(rng.uniform(0.05, 1.5), 3))
+        elif status == "source_unreachable":
+            result.update(real_lead=False, is_fake=True, error="Cannot reach real lead source",
+                          next_action="Debug lead source network connectivity")
+        else:
+            result.update(real_lead=False, is_fake=False, timeout=30)
+        results.append(result)
+    return results
+
+
+def broadcast_records(count: int, seed: int = 2):
+    """Yield broadcast records shaped like the broadcaster's history entries"""
+    rng = random.Random(seed)
+    for i, ts in enumerate(_timestamps(count, rng)):
+        results = _endpoint_results(rng, ENDPOINTS, "endpoint")
+        real = sum(r["real_communication"] for r in results)
+        yield {
+            "broadcast_id": f"broadcast_{int(ts.timestamp())}_{i}",
+            "project": rng.choice(PROJECTS),
+            "progress": round(rng.uniform(0, 100), 1),
+            "endpoints_tested": len(ENDPOINTS),
+            "real_broadcasts": real,
+            "fake_broadcasts": sum(r["fake_logging"] for r in results),
+            "success_rate": real / len(ENDPOINTS),
+            "results": results,
+            "timestamp": ts.isoformat()
+        }
+
+
+def broadcast_history(path: Path, broadcasts: int = 20_000, seed: int = 2) -> Path:
+    history = list(broadcast_records(broadcasts, seed))
+    _write_json(path, {"broadcast_history": history, "total_broadcasts": len(history)})
+    return path
+
+
+def lead_records(count: int, seed: int = 3):
+    """Yield lead campaign records shaped like the lead generator's history entries"""
+    rng = random.Random(seed)
+    for i, ts in enumerate(_timestamps(count, rng)):
+        results = _source_results(rng)
+        real = sum(r["real_lead"] for r in results)
+        yield {
+            "campaign_id": f"campaign_{int(ts.timestamp())}_{i}",
+            "campaign_name": f"Campaign {i % 50}",
+            "lead_type": rng.choice(["parents", "gift", "tourists"]),
+            "sources_tested": len(SOURCES),
+            "real_leads": real,
+            "fake_leads": sum(r["is_fake"] for r in results),
+            "success_rate": real / len(SOURCES),
+            "lead_quality_estimate": real / len(SOURCES) * 100,
+            "results": results,
+            "timestamp": ts.isoformat()
+        }
+
+
+def lead_history(path: Path, campaigns: int = 20_000, seed: int = 3) -> Path:
+    history = list(lead_records(campaigns, seed))
+    _write_json(path, {"lead_history": history, "total_campaigns": len(history)})
+    return path
+
+
+def workspace_tree(root: Path, repos: int = 40, files_per_repo: int = 200, depth: int = 3,
+                   git: bool = True, extra_paths: tuple = (), seed: int = 4) -> Path:
+    """Create ``repos`` projects split across brands/ and projects/, optionally git-initialized
+
+    ``extra_paths`` (relative to ``root``) are populated the same way, e.g. the
+    fixed project paths the status reporter looks for.
+    """
+    rng = random.Random(seed)
+    env = dict(os.environ, GIT_AUTHOR_NAME="bench", GIT_AUTHOR_EMAIL="bench@localhost",
+               GIT_COMMITTER_NAME="bench", GIT_COMMITTER_EMAIL="bench@localhost")
+    paths = [("brands" if i % 3 == 0 else "projects") + f"/repo-{i:03d}" for i in range(repos)]
+    for rel_path in [*paths, *extra_paths]:
+        repo = root / rel_path
+        for j in range(files_per_repo):
+            subdir = repo.joinpath(*(f"d{rng.randint(0, 4)}" for _ in range(rng.randint(0, depth))))
+            subdir.mkdir(parents=True, exist_ok=True)
+            (subdir / f"file-{j}.txt").write_text("x" * rng.randint(10, 4000))
+        if git:
+            subprocess.run(["git", "init", "-q", str(repo)], check=True, env=env)
+            subprocess.run(["git", "-C", str(repo), "add", "-A"], check=True, env=env)
+            subprocess.run(["git", "-C", str(repo), "commit", "-q", "-m", "synthetic"], check=True, env=env)
+    return root
+
+
+def template_tree(root: Path, packages: int = 1_000, files_per_package: int = 20, seed: int = 5) -> Path:
+    """Generated-project stand-in named after ``root``, for the scaffold benchmark"""
+    rng = random.Random(seed)
+    name = root.name
+    _write_json(root / "package.json", {"name": name, "version": "0.1.0", "private": True,
+                                        "scripts": {"dev": "next dev", "build": "next build"}})
+    _write_json(root / "package-lock.json", {"name": name, "lockfileVersion": 3,
+                                             "packages": {"": {"name": name}}})
+    (root / "README.md").write_text(f"# {name}\n\nBootstrapped with create-next-app.\n")
+    for rel_path in ("src/app/page.tsx", "src/app/layout.tsx", "src/app/globals.css", "next.config.ts",
+                     "tsconfig.json", "eslint.config.mjs"):
+        (root / rel_path).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel_path).write_text("x" * rng.randint(100, 2000))
+    for i in range(packages):
+        package = root / "node_modules" / f"pkg-{i:04d}"
+        (package / "lib").mkdir(parents=True)
+        _write_json(package / "package.json", {"name": f"pkg-{i:04d}", "main": "lib/index.js"})
+        for j in range(files_per_package - 1):
+            (package / "lib" / f"m{j}.js").write_text("x" * rng.randint(50, 8000))
+    _write_json(root / "node_modules" / ".package-lock.json", {"name": name, "lockfileVersion": 3, "packages": {}})
+    (root / "node_modules" / ".bin").mkdir()
+    os.symlink("../pkg-0000/lib/m0.js", root / "node_modules" / ".bin" / "pkg-cli")
+    return root
+
+
+def _write_json(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+History Memory Benchmark
+tracemalloc footprint of list-of-dict histories against CompactHistory columns
+**Created**: 2026-10-19
+
+Records are round-tripped through JSON one by one, exactly as the tools load
+them from storage, so every key and endpoint name is a separate string object
+in the list-of-dicts baseline (nothing is shared by accident).
+
+Usage:
+    python3 benchmarks/history_memory.py                     # 1M broadcasts and 1M lead campaigns
+    python3 benchmarks/history_memory.py --records 200000
+    python3 benchmarks/history_memory.py broadcasts --json memory.json
+    python3 benchmarks/history_memory.py --baseline-records 250000
+
+A million list-of-dicts records under tracemalloc need well over 6 GB of RAM;
+``--baseline-records`` measures the baseline on a prefix and scales it
+linearly (reported as extrapolated) while the compact form is measured in full.
+"""
+
+import gc
+import itertools
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import datagen  # noqa: E402
+from compact_history import BROADCAST_FIELDS, LEAD_FIELDS, CompactHistory  # noqa: E402
+
+HISTORIES = {
+    "broadcasts": (datagen.broadcast_records, BROADCAST_FIELDS, "real_broadcasts"),
+    "leads": (datagen.lead_records, LEAD_FIELDS, "real_leads"),
+}
+
+
+def _loaded(path: Path, limit: int = None):
+    """Records as the tools see them after loading from storage, one JSON row each"""
+    with open(path, "r") as f:
+        for line in itertools.islice(f, limit):
+            yield json.loads(line)
+
+
+def measure_footprint(build: Callable[[], object]) -> tuple:
+    """(container, traced bytes it holds, seconds to build)"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    container = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return container, held, elapsed
+
+
+def bench_history(name: str, count: int, baseline_count: int = None) -> Dict[str, dict]:
+    generate, fields, counter = HISTORIES[name]
+    baseline_count = min(count, baseline_count or count)
+    results = {}
+
+    # Generate outside tracemalloc; both representations then stream the same rows
+    fd, rows = tempfile.mkstemp(prefix=f"openclaw-{name}-", suffix=".jsonl")
+    rows = Path(rows)
+    try:
+        with os.fdopen(fd, "w") as f:
+            for record in generate(count):
+                f.write(json.dumps(record) + "\n")
+
+        dicts, held, build_s = measure_footprint(lambda: list(_loaded(rows, baseline_count)))
+        start = time.perf_counter()
+        sum(r[counter] for r in dicts)
+        scale = count / baseline_count
+        results["list_of_dicts"] = {"bytes": int(held * scale), "build_s": build_s * scale,
+                                    "sum_s": (time.perf_counter() - start) * scale,
+                                    "measured_records": baseline_count}
+        del dicts
+        gc.collect()
+
+        compact, held, build_s = measure_footprint(lambda: CompactHistory(fields, _loaded(rows)))
+        start = time.perf_counter()
+        sum(compact.values(counter))
+        results["compact"] = {"bytes": held, "build_s": build_s, "sum_s": time.perf_counter() - start,
+                              "measured_records": count, "symbols": len(compact.symbols),
+                              "overflow_rows": len(compact.overflow)}
+        del compact
+        gc.collect()
+    finally:
+        rows.unlink()
+
+    for metrics in results.values():
+        metrics["bytes_per_record"] = round(metrics["bytes"] / count, 1)
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, dict]], count: int) -> None:
+    print(f"🧠 HISTORY MEMORY ({count:,} records per history, tracemalloc)")
+    header = f"{'history':<14}{'representation':<16}{'MB':>10}{'B/record':>10}{'build s':>10}{'sum s':>9}{'saving':>9}"
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for name, reps in results.items():
+        baseline = reps["list_of_dicts"]["bytes"]
+        for rep, m in reps.items():
+            saving = f"{baseline / m['bytes']:.1f}x" if rep != "list_of_dicts" and m["bytes"] else "-"
+            note = f"  (extrapolated from {m['measured_records']:,})" if m["measured_records"] < count else ""
+            print(f"{name:<14}{rep:<16}{m['bytes'] / 1e6:>10.1f}{m['bytes_per_record']:>10.1f}"
+                  f"{m['build_s']:>10.2f}{m['sum_s']:>9.3f}{saving:>9}{note}")
+    print("-" * len(header))
+
+
+def main(argv: List[str]) -> int:
+    count, baseline_count, json_out, names = 1_000_000, None, None, []
+    i = 0
+    while i < len(argv):
+        if argv[i] == "--records":
+            i += 1
+            count = int(argv[i])
+        elif argv[i] == "--baseline-records":
+            i += 1
+            baseline_count = int(argv[i])
+        elif argv[i] == "--json":
+            i += 1
+            json_out = argv[i]
+        else:
+            names.append(argv[i])
+        i += 1
+
+    results = {name: bench_history(name, count, baseline_count) for name in names or HISTORIES}
+    print_results(results, count)
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Mock Services
+Local stand-ins for GitHub, the OpenClaw community APIs and Discord webhooks
+**Created**: 2026-10-19
+
+Each MockService is a threaded HTTP server on 127.0.0.1 with a configurable
+profile: base latency plus jitter, an optional slow tail, a fraction of 5xx
+errors and a fraction of 429 rate-limit responses (with Retry-After). Every request path answers, so
+a single service can impersonate any endpoint the tools call.
+"""
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+
+@dataclass
+class ServiceProfile:
+    """Response behaviour of a mock service"""
+    latency: float = 0.0          # seconds added to every response
+    jitter: float = 0.0           # +/- uniform jitter in seconds
+    error_rate: float = 0.0       # fraction answered with 503
+    rate_limit_rate: float = 0.0  # fraction answered with 429
+    tail_rate: float = 0.0        # fraction delayed by an extra tail_latency
+    tail_latency: float = 0.0
+    retry_after: int = 1
+    status_overrides: Dict[str, int] = field(default_factory=dict)  # path prefix -> status
+
+    @classmethod
+    def parse(cls, spec: str) -> "ServiceProfile":
+        """Build a profile from "latency=0.05,jitter=0.01,error_rate=0.1,rate_limit_rate=0.05" """
+        values = {}
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            key, _, value = part.partition("=")
+            values[key] = int(value) if key == "retry_after" else float(value)
+        return cls(**values)
+
+
+PROFILES = {
+    "fast": ServiceProfile(),
+    "typical": ServiceProfile(latency=0.02, jitter=0.01),
+    "slow": ServiceProfile(latency=0.2, jitter=0.1),
+    "flaky": ServiceProfile(latency=0.02, jitter=0.01, error_rate=0.1),
+    "throttled": ServiceProfile(latency=0.02, jitter=0.01, rate_limit_rate=0.2),
+    "tail": ServiceProfile(latency=0.02, jitter=0.01, tail_rate=0.05, tail_latency=1.0),
+}
+
+
+class MockService:
+    """Threaded local HTTP server answering GET/HEAD/POST according to a profile"""
+
+    def __init__(self, profile: Optional[ServiceProfile] = None, seed: int = 0):
+        self.profile = profile or ServiceProfile()
+        self.random = random.Random(seed)
+        self.counts = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _decide(self, path: str) -> int:
+        profile = self.profile
+        with self._lock:
+            self.counts["requests"] += 1
+            roll = self.random.random()
+            delay = max(0.0, profile.latency + self.random.uniform(-profile.jitter, profile.jitter))
+            if profile.tail_rate and self.random.random() < profile.tail_rate:
+                delay += profile.tail_latency
+        if delay:
+            time.sleep(delay)
+
+        for prefix, status in profile.status_overrides.items():
+            if path.startswith(prefix):
+                return status
+        if roll < profile.rate_limit_rate:
+            return 429
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            return 503
+        return 200
+
+    def _make_handler(self):
+        service = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, with_body: bool = True):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+                status = service._decide(self.path)
+                key = "ok" if status == 200 else ("rate_limited" if status == 429 else "errors")
+                with service._lock:
+                    service.counts[key] += 1
+
+                body = json.dumps({"status": status, "path": self.path}).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429:
+                    self.send_header("Retry-After", str(service.profile.retry_after))
+                self.end_headers()
+                if with_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self._respond()
+
+            def do_POST(self):
+                self._respond()
+
+            def do_HEAD(self):
+                self._respond(with_body=False)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockService":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import sys
+
+    profile = PROFILES.get(sys.argv[1], None) if len(sys.argv) > 1 else None
+    if profile is None and len(sys.argv) > 1:
+        profile = ServiceProfile.parse(sys.argv[1])
+    with MockService(profile) as service:
+        print(f"🧪 Mock service on {service.base_url} ({service.profile})")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            print(f"\n📊 {service.counts}")
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Benchmark Suite
+Throughput and latency percentiles for the tracker, broadcaster, lead generator and status reporter
+**Created**: 2026-10-19
+
+Every networked code path is pointed at local MockService instances (see
+mock_services.py) and every data file at synthetic fixtures (see datagen.py)
+inside a temporary directory (storage included, via OPENCLAW_DB), so nothing
+touches real endpoints or the real ~/.openclaw state. Results are compared
+against baselines.json; an operation whose p95 regresses past the tolerance
+fails the run. Baselines are absolute milliseconds, so they only mean
+something on the machine that recorded them: re-record with
+--update-baseline before comparing on a different machine.
+
+Usage:
+    python3 benchmarks/run.py                         # all scenarios, "typical" service profile
+    python3 benchmarks/run.py tracker status          # selected scenarios
+    python3 benchmarks/run.py --profile flaky         # fast|typical|slow|flaky|throttled|tail
+    python3 benchmarks/run.py --profile "latency=0.1,rate_limit_rate=0.3"
+    python3 benchmarks/run.py --scale 0.1             # shrink synthetic data and iteration counts
+    python3 benchmarks/run.py --update-baseline
+    python3 benchmarks/run.py --json results.json
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import datagen  # noqa: E402
+from http_policy import HttpPolicy, percentile  # noqa: E402
+from mock_services import PROFILES, MockService, ServiceProfile  # noqa: E402
+from tool_registry import tool_class  # noqa: E402
+
+BASELINE_FILE = BENCH_DIR / "baselines.json"
+REGRESSION_TOLERANCE = 1.25  # p95 may grow 25% over baseline before failing
+
+
+def measure(operation: Callable[[int], None], iterations: int) -> dict:
+    """Run ``operation(i)`` repeatedly with tool output suppressed"""
+    samples = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(iterations):
+            t0 = time.perf_counter()
+            operation(i)
+            samples.append((time.perf_counter() - t0) * 1000)
+    wall = time.perf_counter() - start
+    return {
+        "iterations": iterations,
+        "throughput_ops": round(iterations / wall, 2) if wall else None,
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "p99_ms": round(percentile(samples, 99), 3),
+        "max_ms": round(max(samples), 3)
+    }
+
+
+def bench_tracker(tmp: Path, profile: ServiceProfile, scale: float) -> Dict[str, dict]:
+    data_file = datagen.productivity_history(tmp / "productivity.json", sessions=int(50_000 * scale))
+    tracker = tool_class("tracker")()
+    tracker.data_file = data_file
+    tracker.load_data()  # migrate the synthetic history before timing
+    iterations = max(5, int(20 * scale))
+
+    def session(i):
+        tracker.start_session("benchmark", "development")
+        tracker.end_session(f"iteration {i}")
+
+    return {
+        "start_end_session": measure(session, iterations),
+        "get_stats": measure(lambda i: tracker.get_stats(days=30), iterations),
+        "report": measure(lambda i: tracker.report(), iterations),
+        "load_data": measure(lambda i: tracker.load_data(), iterations)
+    }
+
+
+def bench_broadcaster(tmp: Path, profile: ServiceProfile, scale: float) -> Dict[str, dict]:
+    import requests  # noqa: F401 - the broadcaster needs it; skip cleanly when missing
+
+    history = datagen.broadcast_history(tmp / "community_broadcasts.json", broadcasts=int(2_000 * scale))
+    with MockService(profile, seed=11) as service:
+        broadcaster = tool_class("broadcaster")()
+        broadcaster.data_file = str(history)
+        broadcaster.load_broadcast_history()
+        broadcaster.http_policy = HttpPolicy(tmp / "http_latency.json")
+        for endpoint in broadcaster.community_endpoints:
+            endpoint["url"] = f"{service.base_url}/{endpoint['type']}"
+        iterations = max(5, int(30 * scale))
+        batch = [{"project_name": f"Project {n}", "progress_message": "Benchmark", "completion_percentage": 50.0}
+                 for n in range(10)]
+        return {
+            "broadcast_progress_update": measure(
+                lambda i: broadcaster.broadcast_progress_update(f"Project {i}", "Benchmark", 50.0, "bench"),
+                iterations),
+            "broadcast_progress_updates_x10": measure(
+                lambda i: broadcaster.broadcast_progress_updates(batch, "bench"),
+                iterations),
+            "broadcast_collaboration_invitation": measure(
+                lambda i: broadcaster.broadcast_collaboration_invitation("bench", "peer", f"Project {i}", "Join"),
+                iterations)
+        }
+
+
+def bench_leads(tmp: Path, profile: ServiceProfile, scale: float) -> Dict[str, dict]:
+    import requests  # noqa: F401 - the lead generator needs it; skip cleanly when missing
+
+    history = datagen.lead_history(tmp / "lead_generation.json", campaigns=int(2_000 * scale))
+    with MockService(profile, seed=12) as service:
+        generator = tool_class("leads")()
+        generator.data_file = str(history)
+        generator.load_lead_history()
+        generator.http_policy = HttpPolicy(tmp / "http_latency.json")
+        for source in generator.lead_sources:
+            source["url"] = f"{service.base_url}/{source['type']}"
+        iterations = max(5, int(30 * scale))
+        return {
+            "generate_real_leads": measure(
+                lambda i: generator.generate_real_leads(f"Campaign {i}", "parents", "Benchmark"),
+                iterations)
+        }
+
+
+def bench_status(tmp: Path, profile: ServiceProfile, scale: float) -> Dict[str, dict]:
+    reporter_class = tool_class("status")
+    workspace = datagen.workspace_tree(
+        tmp / "workspace", repos=max(4, int(40 * scale)), files_per_repo=max(10, int(200 * scale)),
+        extra_paths=tuple(reporter_class.LOCAL_PROJECTS)
+    )
+    with MockService(profile, seed=13) as service:
+        reporter = reporter_class()
+        reporter.workspace = str(workspace)
+        reporter.github_api = service.base_url
+        reporter.pages_base = service.base_url
+        reporter.http_policy = HttpPolicy(tmp / "http_latency.json")
+        unhedged = HttpPolicy(tmp / "http_latency_unhedged.json", hedging=False)
+        iterations = max(3, int(10 * scale))
+
+        def check_unhedged(i):
+            reporter.http_policy, hedged = unhedged, reporter.http_policy
+            try:
+                reporter.reset()
+                reporter.check_github_repos()
+            finally:
+                reporter.http_policy = hedged
+
+        return {
+            "run": measure(lambda i: reporter.run(), iterations),
+            "check_github_repos": measure(lambda i: (reporter.reset(), reporter.check_github_repos()), iterations),
+            "check_github_repos_unhedged": measure(check_unhedged, iterations),
+            "check_local_projects": measure(lambda i: (reporter.reset(), reporter.check_local_projects()), iterations),
+            "check_pending_pushes": measure(lambda i: (reporter.reset(), reporter.check_pending_pushes()), iterations)
+        }
+
+
+SCENARIOS = {
+    "tracker": bench_tracker,
+    "broadcaster": bench_broadcaster,
+    "leads": bench_leads,
+    "status": bench_status,
+}
+
+
+def compare(results: dict, baselines: dict) -> List[str]:
+    """Names of operations whose p95 regressed beyond the tolerance"""
+    regressions = []
+    for scenario, operations in results.items():
+        if "skipped" in operations:
+            continue
+        for op, metrics in operations.items():
+            base = baselines.get(scenario, {}).get(op)
+            if not base or "p95_ms" not in metrics:
+                continue
+            metrics["baseline_p95_ms"] = base["p95_ms"]
+            metrics["p95_ratio"] = round(metrics["p95_ms"] / base["p95_ms"], 2) if base["p95_ms"] else None
+            if metrics["p95_ratio"] and metrics["p95_ratio"] > REGRESSION_TOLERANCE:
+                regressions.append(f"{scenario}.{op}")
+    return regressions
+
+
+def print_results(results: dict, profile_name: str) -> None:
+    print(f"📊 OPENCLAW BENCHMARKS (service profile: {profile_name})")
+    header = f"{'scenario.operation':<46}{'ops/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'vs base':>9}"
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for scenario, operations in results.items():
+        if "skipped" in operations:
+            print(f"{scenario:<46}  ⏭️  skipped: {operations['skipped']}")
+            continue
+        for op, m in operations.items():
+            ratio = f"{m['p95_ratio']:.2f}x" if m.get("p95_ratio") else "-"
+            print(f"{scenario + '.' + op:<46}{m['throughput_ops']:>9.1f}{m['p50_ms']:>10.2f}"
+                  f"{m['p95_ms']:>10.2f}{m['p99_ms']:>10.2f}{ratio:>9}")
+    print("-" * len(header))
+
+
+def main(argv: List[str]) -> int:
+    names, profile_name, scale, json_out = [], "typical", 1.0, None
+    update = "--update-baseline" in argv
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--profile":
+            i += 1
+            profile_name = argv[i]
+        elif arg == "--scale":
+            i += 1
+            scale = float(argv[i])
+        elif arg == "--json":
+            i += 1
+            json_out = argv[i]
+        elif not arg.startswith("--"):
+            names.append(arg)
+        i += 1
+
+    profile = PROFILES.get(profile_name) or ServiceProfile.parse(profile_name)
+    results = {}
+    for name in names or SCENARIOS:
+        with tempfile.TemporaryDirectory(prefix=f"openclaw-bench-{name}-") as tmp:
+            os.environ["OPENCLAW_DB"] = str(Path(tmp) / "openclaw.db")
+            try:
+                results[name] = SCENARIOS[name](Path(tmp), profile, scale)
+            except ImportError as e:
+                results[name] = {"skipped": f"missing dependency ({e.name})"}
+
+    baselines = {}
+    if BASELINE_FILE.exists():
+        with open(BASELINE_FILE, "r") as f:
+            baselines = json.load(f)
+    key = f"{profile_name}@{scale:g}"
+    regressions = compare(results, baselines.get(key, {}))
+
+    print_results(results, profile_name)
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump(results, f, indent=2)
+
+    skipped = [scenario for scenario, ops in results.items() if "skipped" in ops]
+    if skipped:
+        print(f"⏭️  Skipped, not compared: {', '.join(skipped)}")
+
+    if update:
+        # Merge, so scenarios that could not run here keep their previous baseline
+        baselines.setdefault(key, {}).update({
+            scenario: {op: {"p95_ms": m["p95_ms"], "p50_ms": m["p50_ms"]} for op, m in ops.items()}
+            for scenario, ops in results.items() if "skipped" not in ops
+        })
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baselines, f, indent=2)
+            f.write("\n")
+        print(f"💾 Baseline updated for {key}: {BASELINE_FILE}")
+        return 0
+
+    if regressions:
+        print(f"❌ p95 regressions (>{REGRESSION_TOLERANCE:.2f}x baseline): {', '.join(regressions)}")
+        return 1
+    print("✅ No regressions against baseline" if baselines.get(key) else "○ No baseline for this profile/scale")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
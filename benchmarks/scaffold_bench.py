@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Scaffold Benchmark
+Template build time against cached scaffolds, single and in parallel
+**Created**: 2026-10-19
+
+The template is a synthetic create-next-app-shaped project (see
+datagen.template_tree) generated by a subprocess, the same way the real
+templates are built with npx, so the cold row is what a first scaffold pays
+on top of the generator itself and the cached rows are every later one.
+
+Usage:
+    python3 benchmarks/scaffold_bench.py                 # 1000 packages, ~20k files
+    python3 benchmarks/scaffold_bench.py --scale 0.2
+    python3 benchmarks/scaffold_bench.py --json scaffold.json
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+from run import measure  # noqa: E402
+from scaffold_engine import ScaffoldEngine  # noqa: E402
+
+PARALLEL_PROJECTS = 8
+
+
+def bench_scaffold(tmp: Path, packages: int) -> Dict[str, dict]:
+    generator = (f"import sys; from pathlib import Path; sys.path.insert(0, {str(BENCH_DIR)!r}); "
+                 f"import datagen; datagen.template_tree(Path(sys.argv[1]), packages={packages})")
+    engine = ScaffoldEngine(tmp / "templates", {"synthetic": {"command": [sys.executable, "-c", generator, "{dir}"]}})
+    out = tmp / "projects"
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        meta = engine.ensure_template("synthetic")
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def scaffold(i):
+        result = engine.init_project(f"site-{i}", "synthetic", out / f"site-{i}")
+        if not result["ok"]:
+            raise RuntimeError(result["error"])
+
+    def scaffold_parallel(i):
+        batch = [(f"batch-{i}-{n}", "synthetic", out / f"batch-{i}-{n}") for n in range(PARALLEL_PROJECTS)]
+        results = engine.init_many(batch)
+        if not all(r["ok"] for r in results):
+            raise RuntimeError([r.get("error") for r in results])
+
+    return {
+        "files": meta["files"],
+        "build_template": {"iterations": 1, "throughput_ops": None, "p50_ms": round(build_ms, 3),
+                           "p95_ms": round(build_ms, 3), "p99_ms": round(build_ms, 3), "max_ms": round(build_ms, 3)},
+        "scaffold_cached": measure(scaffold, 10),
+        f"scaffold_cached_x{PARALLEL_PROJECTS}_parallel": measure(scaffold_parallel, 3)
+    }
+
+
+def print_results(results: Dict[str, dict]) -> None:
+    print(f"🧱 SCAFFOLDING ({results['files']:,} template files)")
+    header = f"{'operation':<32}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for op, m in results.items():
+        if op != "files":
+            print(f"{op:<32}{m['p50_ms']:>10.1f}{m['p95_ms']:>10.1f}{m['max_ms']:>10.1f}")
+    print("-" * len(header))
+
+
+def main(argv: List[str]) -> int:
+    scale, json_out = 1.0, None
+    if "--scale" in argv:
+        scale = float(argv[argv.index("--scale") + 1])
+    if "--json" in argv:
+        json_out = argv[argv.index("--json") + 1]
+
+    with tempfile.TemporaryDirectory(prefix="openclaw-scaffold-bench-") as tmp:
+        results = bench_scaffold(Path(tmp), max(10, int(1_000 * scale)))
+
+    print_results(results)
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
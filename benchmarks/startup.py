@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Startup Time Benchmark
+Measures cold import + construction time of every OpenClaw tool against a budget
+**Created**: 2026-10-19
+
+Each tool is loaded in a fresh interpreter under ``python -X importtime``.
+The importtime lines emitted while the tool loads are parsed so a budget
+violation also names the imports responsible for it, and any eager import
+of a module listed in DEFERRED_IMPORTS fails the run regardless of timing.
+
+Tool and baseline are measured the same way: wall time of a child
+interpreter under ``-X importtime`` running the harness prelude, once on its
+own and once followed by loading and constructing the tool. Budgets are
+limits on that ratio, so a slower machine or a busy CI runner scales every
+limit with it.
+
+Usage:
+    python3 benchmarks/startup.py                 # check against startup_budget.json
+    python3 benchmarks/startup.py --runs 9        # more samples per tool
+    python3 benchmarks/startup.py --update-budget # re-baseline (budget = 1.5x the measured ratio)
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+TOOLS_DIR = BENCH_DIR.parent
+BUDGET_FILE = BENCH_DIR / "startup_budget.json"
+
+sys.path.insert(0, str(TOOLS_DIR))
+from tool_registry import TOOLS  # noqa: E402
+
+MARKER = "--- openclaw tool load ---"
+
+# Heavy modules that must stay deferred until a code path actually needs them
+DEFERRED_IMPORTS = ("requests", "urllib.request", "http.server", "concurrent.futures", "sqlite3")
+
+CHILD_PRELUDE = """
+import sys, time, json
+sys.path.insert(0, {tools_dir!r})
+import tool_registry
+print({marker!r}, file=sys.stderr, flush=True)
+"""
+
+CHILD_SCRIPT = CHILD_PRELUDE + """
+start = time.perf_counter()
+cls = tool_registry.tool_class({name!r})
+loaded = time.perf_counter()
+cls()
+done = time.perf_counter()
+print(json.dumps({{"load_ms": (loaded - start) * 1000, "construct_ms": (done - loaded) * 1000}}))
+"""
+
+
+def parse_importtime(stderr: str) -> list:
+    """Return [(module, self_us, cumulative_us)] for imports made after the marker"""
+    lines = stderr.split(MARKER, 1)[-1].splitlines()
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+            # One separator space, then two spaces of indentation per nesting level
+            imports.append((module.rstrip()[1:], int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return imports
+
+
+BUDGET_HEADROOM = 1.5
+
+
+def run_child(script: str) -> tuple:
+    """Run ``script`` in a fresh ``-X importtime`` interpreter; returns (wall ms, result)"""
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True, text=True, cwd="/tmp"
+    )
+    return (time.perf_counter() - start) * 1000, result
+
+
+def measure_baseline() -> float:
+    """Wall time of the harness prelude alone, the unit budgets are expressed in"""
+    return run_child(CHILD_PRELUDE.format(tools_dir=str(TOOLS_DIR), marker=MARKER))[0]
+
+
+def measure_tool(name: str, runs: int) -> dict:
+    """Median startup metrics for one tool over ``runs`` fresh interpreters"""
+    samples = []
+    walls = []
+    baselines = []
+    imports = []
+    for _ in range(runs):
+        # Each sample is paired with a baseline taken just before it, so machine load
+        # that drifts during the run affects both sides of the ratio alike
+        baselines.append(measure_baseline())
+        script = CHILD_SCRIPT.format(tools_dir=str(TOOLS_DIR), marker=MARKER, name=name)
+        wall_ms, result = run_child(script)
+        if result.returncode != 0:
+            return {"error": result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "failed"}
+        walls.append(wall_ms)
+        samples.append(json.loads(result.stdout.strip().splitlines()[-1]))
+        imports = parse_importtime(result.stderr)
+
+    top_level = [(m, cum) for m, _, cum in imports if not m.startswith(" ")]
+    return {
+        "eager_heavy_imports": sorted({m.strip() for m, _, _ in imports} & set(DEFERRED_IMPORTS)),
+        "wall_ms": round(statistics.median(walls), 2),
+        "baseline_ms": round(statistics.median(baselines), 2),
+        "x_baseline": round(statistics.median(w / b for w, b in zip(walls, baselines)), 2),
+        "startup_ms": round(statistics.median(s["load_ms"] + s["construct_ms"] for s in samples), 2),
+        "load_ms": round(statistics.median(s["load_ms"] for s in samples), 2),
+        "construct_ms": round(statistics.median(s["construct_ms"] for s in samples), 2),
+        "import_ms": round(sum(cum for _, cum in top_level) / 1000, 2),
+        "heaviest_imports": [
+            {"module": m, "cumulative_ms": round(cum / 1000, 2)}
+            for m, cum in sorted(top_level, key=lambda x: -x[1])[:5]
+        ]
+    }
+
+
+def load_budget() -> dict:
+    if BUDGET_FILE.exists():
+        with open(BUDGET_FILE, "r") as f:
+            return json.load(f)
+    return {}
+
+
+def run(runs: int = 5, update_budget: bool = False) -> int:
+    budget = load_budget()
+    measure_baseline()  # warm the page cache
+    results = {name: measure_tool(name, runs) for name in TOOLS}
+    baseline = statistics.median(r["baseline_ms"] for r in results.values() if "error" not in r)
+
+    print("⏱️  TOOL STARTUP TIMES (median of {} runs)".format(runs))
+    print(f"baseline (interpreter + harness prelude, no tool): {baseline:.2f} ms wall; "
+          f"x base = median of paired tool/baseline ratios")
+    print("=" * 72)
+    print(f"{'tool':<14}{'wall ms':>10}{'load ms':>10}{'x base':>9}{'budget':>9}  status")
+    print("-" * 72)
+
+    failures = 0
+    for name, result in results.items():
+        if "error" in result:
+            failures += 1
+            print(f"{name:<14}{'-':>10}{'-':>10}{'-':>9}{'-':>9}  ❌ {result['error']}")
+            continue
+        limit = budget.get(name, {}).get("wall_x_baseline")
+        over = limit is not None and result["x_baseline"] > limit
+        eager = result["eager_heavy_imports"]
+        failures += over or bool(eager)
+        if eager:
+            status = f"❌ eager import of {', '.join(eager)}"
+        elif over:
+            status = "❌ over budget"
+        else:
+            status = "✅" if limit is not None else "○ no budget"
+        print(f"{name:<14}{result['wall_ms']:>10.2f}{result['startup_ms']:>10.2f}{result['x_baseline']:>8.2f}x"
+              + (f"{limit:>8.2f}x" if limit is not None else f"{'-':>9}") + f"  {status}")
+        if over:
+            for entry in result["heaviest_imports"]:
+                print(f"{'':<14}  ↳ {entry['module']}: {entry['cumulative_ms']:.2f} ms")
+
+    if update_budget:
+        new_budget = {
+            name: {"wall_x_baseline": round(result["x_baseline"] * BUDGET_HEADROOM, 2)}
+            for name, result in results.items() if "error" not in result
+        }
+        with open(BUDGET_FILE, "w") as f:
+            json.dump(new_budget, f, indent=2)
+            f.write("\n")
+        print(f"\n💾 Budget updated: {BUDGET_FILE}")
+        return 0
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    runs = 5
+    if "--runs" in sys.argv:
+        runs = int(sys.argv[sys.argv.index("--runs") + 1])
+    sys.exit(run(runs, update_budget="--update-budget" in sys.argv))
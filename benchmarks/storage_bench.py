@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Storage Engine Benchmark
+Write throughput and query latency of the SQLite engine against whole-file JSON
+**Created**: 2026-10-19
+
+Both engines start from the same synthetic productivity history, migrated from
+the legacy JSON shape, and run the operations the tools perform: single
+appends (one per tracked session or broadcast), batched appends, in-place
+updates, recent-window queries and full reads. ``cold_query_recent`` opens
+the store first, which is what each short-lived CLI invocation pays.
+
+Usage:
+    python3 benchmarks/storage_bench.py                # 50k records
+    python3 benchmarks/storage_bench.py --scale 0.1    # 5k records
+    python3 benchmarks/storage_bench.py --json storage.json
+"""
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import datagen  # noqa: E402
+from run import measure  # noqa: E402
+from storage import ENGINES, open_storage  # noqa: E402
+
+COLLECTION = "tracker.sessions"
+RECENT_SINCE = "2026-09-24"  # last week of the synthetic history
+
+
+def bench_engine(engine: str, legacy_file: Path, tmp: Path, scale: float) -> Dict[str, dict]:
+    path = tmp / f"bench-{engine}.store"
+    storage = open_storage(path, engine)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        storage.migrate_json(legacy_file, {"sessions": (COLLECTION, "start")})
+    migrate_ms = (time.perf_counter() - start) * 1000
+
+    record = {"start": "2026-10-01T12:00:00", "project": "benchmark", "type": "development",
+              "status": "active"}
+    single = max(5, int(40 * scale))
+    batch_size = max(100, int(1_000 * scale))
+
+    def append_batch(i):
+        with storage.batch():
+            for _ in range(batch_size):
+                storage.append(COLLECTION, record, record["start"])
+
+    def cold_query_recent(i):
+        # What a fresh CLI invocation pays: open the store, then query
+        fresh = open_storage(path, engine)
+        fresh.records(COLLECTION, since=RECENT_SINCE)
+        fresh.close()
+
+    def update_last(i):
+        record_id, last = storage.last(COLLECTION)
+        last["status"] = "completed"
+        storage.update(COLLECTION, record_id, last)
+
+    results = {
+        "migrate": {"iterations": 1, "throughput_ops": None, "p50_ms": round(migrate_ms, 3),
+                    "p95_ms": round(migrate_ms, 3), "p99_ms": round(migrate_ms, 3), "max_ms": round(migrate_ms, 3)},
+        "append": measure(lambda i: storage.append(COLLECTION, record, record["start"]), single),
+        f"append_batch_{batch_size}": measure(append_batch, 5),
+        "update_last": measure(update_last, single),
+        "query_recent": measure(lambda i: storage.records(COLLECTION, since=RECENT_SINCE), 20),
+        "query_all": measure(lambda i: storage.records(COLLECTION), 5),
+        "cold_query_recent": measure(cold_query_recent, 10),
+        "count": measure(lambda i: storage.count(COLLECTION), 20)
+    }
+    storage.close()
+    return results
+
+
+def print_results(results: Dict[str, Dict[str, dict]], records: int) -> None:
+    engines = list(results)
+    print(f"🗄️  STORAGE ENGINES ({records} records)")
+    header = f"{'operation':<24}" + "".join(f"{e + ' p50':>14}{e + ' p95':>14}" for e in engines) + f"{'speedup':>10}"
+    print("=" * len(header))
+    print(header)
+    print("-" * len(header))
+    for op in results[engines[0]]:
+        row = f"{op:<24}"
+        for engine in engines:
+            m = results[engine][op]
+            row += f"{m['p50_ms']:>14.3f}{m['p95_ms']:>14.3f}"
+        if {"json", "sqlite"} <= set(engines) and results["sqlite"][op]["p50_ms"]:
+            row += f"{results['json'][op]['p50_ms'] / results['sqlite'][op]['p50_ms']:>9.1f}x"
+        print(row)
+    print("-" * len(header))
+    print("Times in ms; speedup = JSON p50 / SQLite p50")
+
+
+def main(argv: List[str]) -> int:
+    scale, json_out = 1.0, None
+    if "--scale" in argv:
+        scale = float(argv[argv.index("--scale") + 1])
+    if "--json" in argv:
+        json_out = argv[argv.index("--json") + 1]
+
+    records = int(50_000 * scale)
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="openclaw-storage-bench-") as tmp:
+        legacy_file = datagen.productivity_history(Path(tmp) / "productivity.json", sessions=records)
+        for engine in ENGINES:
+            results[engine] = bench_engine(engine, legacy_file, Path(tmp), scale)
+
+    print_results(results, records)
+    if json_out:
+        with open(json_out, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -6,20 +6,86 @@ REAL community broadcasting system vs fake console logging
 """
 
 import time
-import json
+import math
 import datetime
-from pathlib import Path
-import requests
-from typing import Dict, List, Optional
+
+from compact_history import BROADCAST_FIELDS, INVITATION_FIELDS, CompactHistory
+from http_policy import default_policy
+from storage import open_storage
+from tracing import span
+
+BROADCASTS = "broadcasts"
+INVITATIONS = "invitations"
 
 class RealCommunityBroadcaster:
     """Actually broadcast progress to real OpenClaw community vs fake console logging"""
     
+    STORAGE_KEYS = (BROADCASTS, INVITATIONS)
+    
     def __init__(self):
-        self.broadcast_history = []
+        self._broadcast_history = None
+        self._invitation_history = None
+        self._session = None
+        self._storage = None
+        self._http_policy = None
+        # Legacy JSON file, imported into the shared storage on first use
         self.data_file = "/tmp/community_broadcasts.json"
         self.community_endpoints = self._get_real_community_endpoints()
-        self.load_broadcast_history()
+    
+    @property
+    def session(self):
+        """Shared HTTP session so repeated broadcasts reuse pooled connections"""
+        if self._session is None:
+            import requests  # deferred: only needed when actually broadcasting
+            self._session = requests.Session()
+        return self._session
+    
+    @property
+    def broadcast_history(self) -> CompactHistory:
+        """Broadcast history, loaded from storage on first access"""
+        if self._broadcast_history is None:
+            self._broadcast_history = self.load_broadcast_history()
+        return self._broadcast_history
+    
+    @property
+    def invitation_history(self) -> CompactHistory:
+        """Invitation history, loaded from storage on first access"""
+        if self._invitation_history is None:
+            self._invitation_history = self.load_invitation_history()
+        return self._invitation_history
+    
+    @property
+    def storage(self):
+        if self._storage is None:
+            self._storage = open_storage()
+            self._storage.migrate_json(self.data_file, {
+                "broadcast_history": (BROADCASTS, "timestamp"),
+                "invitation_history": (INVITATIONS, "timestamp")
+            })
+        return self._storage
+    
+    @storage.setter
+    def storage(self, value):
+        self._storage = value
+    
+    @property
+    def http_policy(self):
+        """Per-host adaptive timeouts (see http_policy.py)"""
+        if self._http_policy is None:
+            self._http_policy = default_policy()
+        return self._http_policy
+    
+    @http_policy.setter
+    def http_policy(self, value):
+        self._http_policy = value
+    
+    def load_broadcast_history(self) -> CompactHistory:
+        """Load previously saved broadcasts from storage into compact columns"""
+        return CompactHistory(BROADCAST_FIELDS, self.storage.iter_records(BROADCASTS))
+    
+    def load_invitation_history(self) -> CompactHistory:
+        """Load previously saved invitations from storage into compact columns"""
+        return CompactHistory(INVITATION_FIELDS, self.storage.iter_records(INVITATIONS))
         
     def _get_real_community_endpoints(self) -> list:
         """Get real OpenClaw community communication endpoints vs fake endpoints"""
@@ -28,33 +94,36 @@ class RealCommunityBroadcaster:
                 "name": "OpenClaw Main Community",
                 "url": "https://community.openclaw.ai/api/broadcast",
                 "type": "main_community",
-                "auth_required": True
+                "auth_required": True,
+                "supports_digest": True
             },
             {
                 "name": "French Community Chat",
                 "url": "https://fr.openclaw.community/api/messages",
                 "type": "french_community",
-                "auth_required": True
+                "auth_required": True,
+                "supports_digest": True
             },
             {
                 "name": "Moltbook Community",
                 "url": "https://moltbook.openclaw.com/api/posts", 
                 "type": "moltbook_community",
-                "auth_required": True
+                "auth_required": True,
+                "supports_digest": False
             },
             {
                 "name": "Community Discord",
                 "url": "https://discord.com/api/webhooks/openclaw-community",
                 "type": "discord_community",
-                "auth_required": True
+                "auth_required": True,
+                "supports_digest": True
             }
         ]
     
-    def broadcast_progress_update(self, project_name: str, progress_message: str, 
-                                completion_percentage: float, contributor: str = None) -> bool:
-        """Broadcast progress update to REAL community vs fake console logging"""
-        
-        broadcast_data = {
+    def _progress_payload(self, project_name: str, progress_message: str,
+                          completion_percentage: float, contributor: str = None) -> dict:
+        """Payload for a single progress update"""
+        return {
             "project_name": project_name,
             "progress_message": progress_message, 
             "completion_percentage": completion_percentage,
@@ -64,47 +133,121 @@ class RealCommunityBroadcaster:
             "community_context": "Livre Magique France Market Entry",
             "call_to_action": "Want to collaborate? Join us!",
             "hashtags": ["#Collaboration", "#OpenClaw", "#France", "#PersonalizedStories"]
-        } 
+        }
+    
+    def _digest_payload(self, payloads: list) -> dict:
+        """One payload carrying several progress updates, for endpoints that accept digests"""
+        updates = [{
+            "project_name": p["project_name"],
+            "progress_message": p["progress_message"],
+            "completion_percentage": p["completion_percentage"],
+            "contributor": p["contributor"]
+        } for p in payloads]
+        return {
+            "broadcast_type": "progress_digest",
+            "updates": updates,
+            "summary": "\n".join(
+                f"• {u['project_name']}: {u['progress_message']} ({u['completion_percentage']}%)" for u in updates
+            ),
+            "timestamp": datetime.datetime.now().isoformat(),
+            "community_context": "Livre Magique France Market Entry",
+            "call_to_action": "Want to collaborate? Join us!",
+            "hashtags": ["#Collaboration", "#OpenClaw", "#France", "#PersonalizedStories"]
+        }
+    
+    def _deliver(self, endpoint: dict, payload: dict, label: str = "") -> dict:
+        """Send one payload to one endpoint, turning exceptions into a failed result"""
+        try:
+            with span("broadcast.endpoint", "network", endpoint=endpoint["name"],
+                      updates=len(payload.get("updates", ())) or 1) as sp:
+                result = self._send_to_real_endpoint(endpoint, payload)
+                sp.set(status=result["status"])
+            print(f"📡 {endpoint['name']}: {result['status']}{label}")
+            return result
+        except Exception as e:
+            print(f"❌ {endpoint['name']}: {e}")
+            return {
+                "endpoint": endpoint['name'],
+                "status": "failed",
+                "error": str(e)
+            }
+    
+    def broadcast_progress_update(self, project_name: str, progress_message: str, 
+                                completion_percentage: float, contributor: str = None) -> bool:
+        """Broadcast progress update to REAL community vs fake console logging"""
         
-        print(f"📡 BROADCASTING: {project_name} - {progress_message} ({completion_percentage}%) to real community")
+        return self.broadcast_progress_updates([{
+            "project_name": project_name,
+            "progress_message": progress_message,
+            "completion_percentage": completion_percentage,
+            "contributor": contributor
+        }])[0]
+    
+    def broadcast_progress_updates(self, updates: list, contributor: str = None) -> list:
+        """Broadcast several progress updates at once
         
-        # Test real community endpoints vs fake endpoints
-        broadcast_results = []
+        Each update is a dict with project_name, progress_message,
+        completion_percentage and optionally contributor. Endpoints flagged
+        ``supports_digest`` receive one digest payload for the whole batch; the
+        others get one request per update. Every update is still recorded in
+        history with its own per-endpoint results and success rate.
+        Returns one (delivered, success_rate) pair per update.
+        """
         
-        for endpoint in self.community_endpoints:
-            try:
-                result = self._send_to_real_endpoint(endpoint, broadcast_data)
-                broadcast_results.append(result)
-                print(f"📡 {endpoint['name']}: {result['status']}")
-            except Exception as e:
-                print(f"❌ {endpoint['name']}: {e}")
-                broadcast_results.append({
-                    "endpoint": endpoint['name'],
-                    "status": "failed",
-                    "error": str(e)
-                })
+        payloads = [
+            self._progress_payload(u["project_name"], u["progress_message"], u["completion_percentage"],
+                                   u.get("contributor") or contributor)
+            for u in updates
+        ]
+        batched = len(payloads) > 1
         
-        # Test real vs fake
-        real_broadcasts = [r for r in broadcast_results if r.get('real_communication') == True]
-        fake_broadcasts = [r for r in broadcast_results if r.get('fake_logging')] == True
+        for p in payloads:
+            print(f"📡 BROADCASTING: {p['project_name']} - {p['progress_message']} ({p['completion_percentage']}%) to real community")
         
-        success_rate = len(real_broadcasts) / len(self.community_endpoints)
+        # Test real community endpoints vs fake endpoints
+        update_results = [[] for _ in payloads]
         
-        broadcast_result = {
-            "broadcast_id": f"broadcast_{int(time.time())}",
-            "project": project_name,
-            "progress": completion_percentage,
-            "endpoints_tested": len(self.community_endpoints),
-            "real_broadcasts": len(real_broadcasts),
-            "fake_broadcasts": len(fake_broadcasts),
-            "success_rate": success_rate,
-            "results": broadcast_results,
-            "timestamp": datetime.datetime.now().isoformat()
-        }
+        for endpoint in self.community_endpoints:
+            if batched and endpoint.get("supports_digest"):
+                result = self._deliver(endpoint, self._digest_payload(payloads), f" (digest of {len(payloads)})")
+                result["delivery_mode"] = "digest"
+                for results in update_results:
+                    results.append(dict(result))
+            else:
+                for payload, results in zip(payloads, update_results):
+                    result = self._deliver(endpoint, payload)
+                    if batched:
+                        result["delivery_mode"] = "fanout"
+                    results.append(result)
         
-        self._save_broadcast(broadcast_result)
+        batch_id = f"batch_{int(time.time())}_{len(payloads)}" if batched else None
+        outcomes = []
+        with span("broadcast.save", "io", updates=len(payloads)), self.storage.batch():
+            for i, (payload, broadcast_results) in enumerate(zip(payloads, update_results)):
+                # Test real vs fake
+                real_broadcasts = [r for r in broadcast_results if r.get('real_communication') == True]
+                fake_broadcasts = [r for r in broadcast_results if r.get('fake_logging') == True]
+                
+                success_rate = len(real_broadcasts) / len(self.community_endpoints)
+                
+                broadcast_result = {
+                    "broadcast_id": f"broadcast_{int(time.time())}" + (f"_{i}" if batched else ""),
+                    "project": payload["project_name"],
+                    "progress": payload["completion_percentage"],
+                    "endpoints_tested": len(self.community_endpoints),
+                    "real_broadcasts": len(real_broadcasts),
+                    "fake_broadcasts": len(fake_broadcasts),
+                    "success_rate": success_rate,
+                    "results": broadcast_results,
+                    "timestamp": datetime.datetime.now().isoformat()
+                }
+                if batch_id:
+                    broadcast_result["batch_id"] = batch_id
+                
+                self._save_broadcast(broadcast_result)
+                outcomes.append((bool(real_broadcasts), success_rate))
         
-        return bool(real_broadcasts), success_rate
+        return outcomes
     
     def broadcast_collaboration_invitation(self, inviting_agent: str, target_agent: str, 
                                         project_name: str, invitation_message: str) -> bool:
@@ -129,7 +272,9 @@ class RealCommunityBroadcaster:
         
         for endpoint in self.community_endpoints:
             try:
-                result = self._send_invitation_to_community(endpoint, invitation_data)
+                with span("invitation.endpoint", "network", endpoint=endpoint["name"]) as sp:
+                    result = self._send_invitation_to_community(endpoint, invitation_data)
+                    sp.set(status=result["status"])
                 invitation_results.append(result)
                 print(f"💌 {endpoint['name']}: {result['status']}")
             except Exception as e:
@@ -159,13 +304,19 @@ class RealCommunityBroadcaster:
             "timestamp": datetime.datetime.now().isoformat()
         }
         
-        self._save_invitation(invitation_result)
+        with span("invitation.save", "io"):
+            self._save_invitation(invitation_result)
         
         return bool(invitation_results), success_invitations / total_invitations
     
     def _send_to_real_endpoint(self, endpoint: dict, data: dict) -> dict:
         """Send data to REAL community endpoint vs fake endpoint"""
         
+        import requests  # deferred: only needed when actually broadcasting
+        
+        # POSTs aren't idempotent, so no hedging here - only the adaptive deadline
+        timeout = self.http_policy.timeout_for(endpoint["url"], 30)
+        
         try:
             # Use real OpenClaw community API
             headers = {
@@ -175,11 +326,11 @@ class RealCommunityBroadcaster:
             }
             
             # This reaches REAL OpenClaw community vs fake console
-            response = requests.post(
+            response = self.http_policy.request(
                 endpoint["url"],
-                json=data,
-                headers=headers,
-                timeout=30
+                lambda t: self.session.post(endpoint["url"], json=data, headers=headers, timeout=t),
+                timeout,
+                timeout_errors=(requests.exceptions.Timeout,)
             )
             
             if response.status_code == 200:
@@ -207,7 +358,7 @@ class RealCommunityBroadcaster:
                 "status": "timeout",
                 "real_communication": False,
                 "fake_logging": False,
-                "timeout": 30
+                "timeout": math.ceil(timeout)
             }
             
         except requests.exceptions.ConnectionError:
@@ -221,47 +372,32 @@ class RealCommunityBroadcaster:
                 "next_action": "Debug community network connectivity"
             }
     
+    def _send_invitation_to_community(self, endpoint: dict, data: dict) -> dict:
+        """Send collaboration invitation to REAL community endpoint vs fake invitation logging"""
+        
+        result = self._send_to_real_endpoint(endpoint, data)
+        result["invitation_sent"] = result.get("real_communication", False)
+        return result
+    
     def _save_broadcast(self, broadcast_data: dict) -> None:
         """Save broadcast history for tracking real community outreach"""
-        self.broadcast_history.append(broadcast_data)
+        if self._broadcast_history is not None:
+            self._broadcast_history.append(broadcast_data)
         
         try:
-            with open(self.data_file, "w") as f:
-                f.write(json.dumps({
-                    "broadcast_history": self.broadcast_history,
-                    "last_updated": datetime.datetime.now().isoformat(),
-                    "total_broadcasts": len(self.broadcast_history),
-                    "community_integration": "test_mode",
-                    "tested_endpoints": self._get_real_community_endpoints()
-                }, indent=2, default=str))
-                
-            print(f"📋 Broadcasting history saved to {self.data_file}")
+            self.storage.append(BROADCASTS, broadcast_data, broadcast_data.get("timestamp"))
+            print(f"📋 Broadcasting history saved to {self.storage.path}")
             
         except Exception as e:
             print(f"Warning: Could not save broadcast history: {e}")
     
     def _save_invitation(self, invitation_data: dict) -> None:
         """Save invitation history for tracking real community invitations"""
-        invitations_history = []
-        if Path(self.data_file).exists():
-            try:
-                with open(self.data_file, "r") as f:
-                    data = json.load(f)
-                    invitations_history = data.get("invitation_history", [])
-            except:
-                pass
-        
-        invitations_history.append(invitation_data)
+        if self._invitation_history is not None:
+            self._invitation_history.append(invitation_data)
         
         try:
-            with open(self.data_file, "w") as f:
-                json.dump({
-                    "broadcast_history": self.broadcast_history,
-                    "invitation_history": invitations_history,
-                    "last_updated": datetime.datetime.now().isoformat(),
-                    "total_invitations": len(invitations_history),
-                    "community_integration": "test_mode"
-                }, f, indent=2, default=str)
+            self.storage.append(INVITATIONS, invitation_data, invitation_data.get("timestamp"))
                 
         except Exception as e:
             print(f"Warning: Could not save invitation history: {e}")
@@ -278,6 +414,11 @@ class RealCommunityBroadcaster:
             "Test Agent"
         )
         
+        batch_results = self.broadcast_progress_updates([
+            {"project_name": "Test Project", "progress_message": "Testing batch broadcasting", "completion_percentage": 50.0},
+            {"project_name": "Test Project 2", "progress_message": "Testing batch broadcasting", "completion_percentage": 75.0}
+        ], "Test Agent")
+        
         invitation_result = self.broadcast_collaboration_invitation(
             "Test Agent", 
             "Target Agent", 
@@ -289,6 +430,7 @@ class RealCommunityBroadcaster:
             "testing": "complete",
             "broadcast_test": test_broadcast_result[0],
             "broadcast_success_rate": test_broadcast_result[1],
+            "batch_test": all(delivered for delivered, _ in batch_results),
             "invitation_test": invitation_result[0], 
             "invitation_success_rate": invitation_result[1],
             "system_status": "operational",
@@ -296,6 +438,10 @@ class RealCommunityBroadcaster:
         }
 
 if __name__ == "__main__":
+    import sys
+    from tracing import init_from_argv
+    
+    init_from_argv(sys.argv)
     broadcaster = RealCommunityBroadcaster()
     test_results = broadcaster.test_system_functionality()
     
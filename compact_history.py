@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Compact History Records
+Struct-of-arrays containers for broadcast, invitation and lead histories
+**Created**: 2026-10-19
+
+A history is a table of typed ``array`` columns, one per known field.
+Repeated strings (endpoint and source names, statuses, error messages) are
+interned to small integer ids. Each record's per-target results are
+flattened into a child table addressed by an offsets column. Values that
+don't fit their column (unknown keys, unexpected types) are kept verbatim
+in a sparse per-row overflow dict, so every record round-trips exactly.
+
+Indexing or iterating a history materializes plain dicts, so callers keep
+treating it as a list of records; ``values()`` reads one field without
+materializing anything.
+"""
+
+import datetime
+import math
+from array import array
+
+_ABSENT_INT = -2 ** 63
+_ABSENT_BOOL = -1
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MISSING = object()
+
+ENDPOINT_RESULT_FIELDS = (
+    ("endpoint", "sym"),
+    ("status", "sym"),
+    ("response_code", "int"),
+    ("real_communication", "bool"),
+    ("fake_logging", "bool"),
+    ("invitation_sent", "bool"),
+    ("delivery_time", "float"),
+    ("response_text", "sym"),
+    ("timeout", "int"),
+    ("error", "sym"),
+    ("next_action", "sym"),
+    ("delivery_mode", "sym"),
+)
+
+SOURCE_RESULT_FIELDS = (
+    ("source", "sym"),
+    ("status", "sym"),
+    ("response_code", "int"),
+    ("lead_type", "sym"),
+    ("lead_quality", "sym"),
+    ("real_lead", "bool"),
+    ("is_fake", "bool"),
+    ("response_time", "float"),
+    ("response_text", "sym"),
+    ("timeout", "int"),
+    ("error", "sym"),
+    ("next_action", "sym"),
+)
+
+BROADCAST_FIELDS = (
+    ("broadcast_id", "str"),
+    ("project", "sym"),
+    ("progress", "float"),
+    ("endpoints_tested", "int"),
+    ("real_broadcasts", "int"),
+    ("fake_broadcasts", "int"),
+    ("success_rate", "float"),
+    ("results", ENDPOINT_RESULT_FIELDS),
+    ("timestamp", "time"),
+    ("batch_id", "str"),
+)
+
+INVITATION_FIELDS = (
+    ("invitation_id", "str"),
+    ("inviting_agent", "sym"),
+    ("target_agent", "sym"),
+    ("project_name", "sym"),
+    ("endpoints_tested", "int"),
+    ("real_invitations", "int"),
+    ("fake_invitations", "int"),
+    ("success_rate", "float"),
+    ("results", ENDPOINT_RESULT_FIELDS),
+    ("timestamp", "time"),
+)
+
+LEAD_FIELDS = (
+    ("campaign_id", "str"),
+    ("campaign_name", "sym"),
+    ("lead_type", "sym"),
+    ("sources_tested", "int"),
+    ("real_leads", "int"),
+    ("fake_leads", "int"),
+    ("success_rate", "float"),
+    ("lead_quality_estimate", "float"),
+    ("results", SOURCE_RESULT_FIELDS),
+    ("timestamp", "time"),
+    ("next_follow_up", "time"),
+)
+
+
+class SymbolTable:
+    """Interns repeated strings as small integer ids; id 0 means absent"""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self):
+        self.ids = {}
+        self.names = [None]
+
+    def __len__(self) -> int:
+        return len(self.names) - 1
+
+    def intern(self, name: str) -> int:
+        symbol = self.ids.get(name)
+        if symbol is None:
+            symbol = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return symbol
+
+
+def _encode_time(value: str) -> int:
+    """Microseconds since the epoch for a naive ISO timestamp that round-trips exactly"""
+    moment = datetime.datetime.fromisoformat(value)
+    if moment.tzinfo is not None or moment.isoformat() != value:
+        raise ValueError(value)
+    return (moment - _EPOCH) // datetime.timedelta(microseconds=1)
+
+
+def _decode_time(micros: int) -> str:
+    return (_EPOCH + datetime.timedelta(microseconds=micros)).isoformat()
+
+
+def _appender(kind, column, symbols: SymbolTable):
+    """Specialized ``add(value) -> fits`` that appends one encoded value (or the absent marker)"""
+    if isinstance(kind, tuple):
+        offsets, child = column
+        append = offsets.append
+
+        def add(value):
+            fits = type(value) is list and all(type(item) is dict for item in value)
+            if fits:
+                child.extend(value)
+            append(child.size)
+            return fits
+        return add
+
+    append = column.append
+    if kind == "str":
+        def add(value):
+            fits = type(value) is str
+            append(value if fits else None)
+            return fits
+    elif kind == "sym":
+        ids, intern = symbols.ids, symbols.intern
+
+        def add(value):
+            if type(value) is str:
+                symbol = ids.get(value)
+                append(intern(value) if symbol is None else symbol)
+                return True
+            append(0)
+            return False
+    elif kind == "int":
+        def add(value):
+            fits = type(value) is int and _ABSENT_INT < value < 2 ** 63
+            append(value if fits else _ABSENT_INT)
+            return fits
+    elif kind == "float":
+        def add(value):
+            fits = type(value) is float and value == value  # NaN marks absent
+            append(value if fits else math.nan)
+            return fits
+    elif kind == "bool":
+        def add(value):
+            fits = type(value) is bool
+            append(value if fits else _ABSENT_BOOL)
+            return fits
+    elif kind == "time":
+        def add(value):
+            if type(value) is str:
+                try:
+                    append(_encode_time(value))
+                    return True
+                except ValueError:
+                    pass
+            append(_ABSENT_INT)
+            return False
+    return add
+
+
+class CompactHistory:
+    """Append-only list of records stored column-wise"""
+
+    __slots__ = ("fields", "columns", "symbols", "overflow", "size", "_plan", "_nested")
+
+    def __init__(self, fields: tuple, records=(), symbols: SymbolTable = None):
+        self.fields = fields
+        self.symbols = symbols or SymbolTable()
+        self.overflow = {}  # row -> {key: value} for values that don't fit a column
+        self.size = 0
+        self.columns = {}
+        for name, kind in fields:
+            if kind == "str":
+                self.columns[name] = []
+            elif kind == "sym":
+                self.columns[name] = array("I")
+            elif kind in ("int", "time"):
+                self.columns[name] = array("q")
+            elif kind == "float":
+                self.columns[name] = array("d")
+            elif kind == "bool":
+                self.columns[name] = array("b")
+            else:  # nested records: (offsets, child table)
+                self.columns[name] = (array("I", [0]), CompactHistory(kind, symbols=self.symbols))
+        self._plan = [(name, _appender(kind, self.columns[name], self.symbols)) for name, kind in fields]
+        self._nested = {name for name, kind in fields if isinstance(kind, tuple)}
+        self.extend(records)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        for row in range(self.size):
+            yield self._record(row)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._record(row) for row in range(*index.indices(self.size))]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("history index out of range")
+        return self._record(index)
+
+    def __bool__(self) -> bool:
+        return self.size > 0
+
+    def extend(self, records) -> None:
+        for record in records:
+            self.append(record)
+
+    def append(self, record: dict) -> None:
+        row = self.size
+        extra = None
+        present = 0
+        get = record.get
+
+        for name, add in self._plan:
+            value = get(name, _MISSING)
+            if value is _MISSING:
+                add(value)
+                if name in self._nested:  # an empty range can't tell "absent" from []
+                    extra = extra or {}
+                    extra[name] = _MISSING
+                continue
+            present += 1
+            if not add(value):
+                extra = extra or {}
+                extra[name] = value
+
+        if present < len(record):
+            extra = extra or {}
+            extra.update((key, value) for key, value in record.items() if key not in self.columns)
+        if extra:
+            self.overflow[row] = extra
+        self.size += 1
+
+    def _value(self, name: str, kind, row: int):
+        """Decoded column value, or _MISSING when the row has none"""
+        column = self.columns[name]
+        if kind == "str":
+            value = column[row]
+            return _MISSING if value is None else value
+        if kind == "sym":
+            symbol = column[row]
+            return self.symbols.names[symbol] if symbol else _MISSING
+        if kind == "int":
+            value = column[row]
+            return _MISSING if value == _ABSENT_INT else value
+        if kind == "float":
+            value = column[row]
+            return _MISSING if math.isnan(value) else value
+        if kind == "bool":
+            value = column[row]
+            return _MISSING if value == _ABSENT_BOOL else bool(value)
+        if kind == "time":
+            value = column[row]
+            return _MISSING if value == _ABSENT_INT else _decode_time(value)
+        offsets, child = column
+        if name in self.overflow.get(row, ()):
+            return _MISSING
+        return [child._record(i) for i in range(offsets[row], offsets[row + 1])]
+
+    def _record(self, row: int) -> dict:
+        record = {}
+        for name, kind in self.fields:
+            value = self._value(name, kind, row)
+            if value is not _MISSING:
+                record[name] = value
+        extra = self.overflow.get(row)
+        if extra:
+            record.update((key, value) for key, value in extra.items() if value is not _MISSING)
+        return record
+
+    def values(self, name: str, default=None):
+        """Yield one field of every record without materializing the records"""
+        kind = dict(self.fields)[name]
+        for row in range(self.size):
+            extra = self.overflow.get(row)
+            if extra and name in extra:
+                yield default if extra[name] is _MISSING else extra[name]
+                continue
+            value = self._value(name, kind, row)
+            yield default if value is _MISSING else value
@@ -6,19 +6,109 @@ Automated tracking of Wonderbly, competitors, and market opportunities
 """
 
 import json
+import re
 import time
 import datetime
-import requests
 from pathlib import Path
 
+from price_history import PriceHistory
+from section_cache import SectionCache
+from storage import DocumentMap, open_storage
+from tracing import span
+
+TRACKING_DATA = "competitors.tracking"
+
+WONDERBLY_FR_URL = "https://fr.wonderbly.com"
+
 class CompetitorMonitor:
     """Automated competitor analysis and market monitoring"""
     
+    STORAGE_KEYS = (TRACKING_DATA,)
+    
     def __init__(self):
-        self.tracking_data = {}
+        # Heavy state is created on first access so constructing the monitor stays cheap
+        self._tracking_data = None
+        self._price_history = None
+        self._section_cache = None
+        self._storage = None
+        # Legacy JSON file, imported into the shared storage on first use
         self.data_file = "/tmp/competitor_data.json"
-        self.load_tracking_data()
+        self.site_data = {}
+    
+    @property
+    def tracking_data(self) -> DocumentMap:
+        """Tracking data as a lazy mapping: each top-level entry is read on first access"""
+        if self._tracking_data is None:
+            self._tracking_data = self.load_tracking_data()
+        return self._tracking_data
+    
+    @tracking_data.setter
+    def tracking_data(self, value: dict) -> None:
+        self.tracking_data.replace(value)
+    
+    @property
+    def price_history(self) -> PriceHistory:
+        if self._price_history is None:
+            self._price_history = PriceHistory()
+        return self._price_history
+    
+    @property
+    def section_cache(self) -> SectionCache:
+        if self._section_cache is None:
+            self._section_cache = SectionCache(Path.home() / ".openclaw" / "competitor_report_sections.json")
+        return self._section_cache
+    
+    @property
+    def storage(self):
+        if self._storage is None:
+            self._storage = open_storage()
+            self._storage.migrate_json(self.data_file, whole=TRACKING_DATA)
+        return self._storage
+    
+    @storage.setter
+    def storage(self, value):
+        self._storage = value
+    
+    def load_tracking_data(self) -> DocumentMap:
+        """Open persisted tracking data without parsing its entries"""
+        return DocumentMap(self.storage, TRACKING_DATA)
+    
+    def save_tracking_data(self) -> None:
+        """Persist the current tracking data, including entries changed in place"""
+        self.tracking_data.flush()
+
+    def refresh_competitor_sites(self, fetcher=None) -> dict:
+        """Fetch every tracked competitor website concurrently and cache extracted fields"""
+        
+        from competitor_fetcher import CompetitorFetcher, normalize_url
+        
+        fetcher = fetcher or CompetitorFetcher()
+        websites = [self.monitor_wonderbly_france()["website_fr"]]
+        for group in self.monitor_local_competitors().values():
+            websites.extend(c["website"] for c in group)
         
+        results = fetcher.fetch_all(websites)
+        self.site_data = {normalize_url(site): result for site, result in results.items()}
+        
+        for site, result in results.items():
+            print(f"🌐 {site}: {result['status']} ({result['elapsed']:.2f}s)")
+        
+        return results
+    
+    def _apply_site_data(self, entry: dict, website: str, field_map: dict) -> dict:
+        """Overlay fetched fields onto a competitor entry, keeping static values as fallback"""
+        
+        if not self.site_data:
+            return entry
+        
+        from competitor_fetcher import normalize_url
+        
+        fetched = self.site_data.get(normalize_url(website), {}).get("fields", {})
+        for source_key, target_key in field_map.items():
+            if source_key in fetched:
+                entry[target_key] = fetched[source_key]
+        return entry
+
     def monitor_wonderbly_france(self) -> dict:
         """Monitor Wonderbly's French market presence"""
         
@@ -27,7 +117,7 @@ class CompetitorMonitor:
             "market": "France",
             "market_entry": "2016-2018 (estimated)",
             "current_status": "Active",
-            "website_fr": "https://fr.wonderbly.com",
+            "website_fr": WONDERBLY_FR_URL,
             "pricing_range": "€25-70",
             "delivery_time_fr": "7-14 jours (estimé)",
             "localization_level": "Adaptation vs création locale",
@@ -58,7 +148,10 @@ class CompetitorMonitor:
             ]
         }
         
-        return wonderbly_france
+        return self._apply_site_data(wonderbly_france, wonderbly_france["website_fr"], {
+            "pricing_range": "pricing_range",
+            "delivery_time": "delivery_time_fr"
+        })
     
     def monitor_local_competitors(self) -> dict:
         """Monitor French local competitors in personalized books"""
@@ -98,6 +191,13 @@ class CompetitorMonitor:
             ]
         }
         
+        for group in local_competitors.values():
+            for competitor in group:
+                self._apply_site_data(competitor, competitor["website"], {
+                    "pricing_range": "pricing_range",
+                    "delivery_time": "delivery_time"
+                })
+        
         return local_competitors
     
     def analyze_market_opportunities(self) -> dict:
@@ -171,21 +271,105 @@ class CompetitorMonitor:
         
         return pricing_data
     
+    def _live_price_points(self) -> dict:
+        """Fetched ``pricing_range`` per competitor, keyed like the static tiers"""
+        
+        if not self.site_data:
+            return {}
+        
+        from competitor_fetcher import normalize_url
+        
+        competitors = [("wonderbly_france", self.monitor_wonderbly_france()["website_fr"])]
+        for group in self.monitor_local_competitors().values():
+            competitors.extend(
+                (re.sub(r"\W+", "_", c["name"].lower()).strip("_"), c["website"]) for c in group
+            )
+        
+        points = {}
+        for competitor, website in competitors:
+            fields = self.site_data.get(normalize_url(website), {}).get("fields", {})
+            if "pricing_range" in fields:
+                points[(competitor, "live")] = fields["pricing_range"]
+        return points
+    
+    def record_pricing_sample(self, date=None) -> int:
+        """Store today's fetched price points per competitor in the price history
+        
+        Only prices parsed by ``refresh_competitor_sites`` are recorded, under
+        the "live" tier; without a fetch nothing is stored, so trends never
+        describe the static ``collect_competitor_pricing`` table.
+        """
+        
+        tiers = self._live_price_points()
+        recorded = sum(
+            self.price_history.record(competitor, tier, price_text, date)
+            for (competitor, tier), price_text in tiers.items()
+        )
+        self.price_history.save()
+        return recorded
+    
+    def analyze_price_trends(self) -> dict:
+        """Computed price deltas, ranges and trends from the stored price history"""
+        
+        return self.price_history.summarize()
+    
+    def _pricing_summary_text(self, trends: dict) -> str:
+        """One-line computed pricing summary for the executive summary"""
+        
+        wonderbly = trends.get("wonderbly_france/live")
+        if not wonderbly or not wonderbly["change_30d"]:
+            return "Historique de prix insuffisant pour calculer une évolution."
+        
+        change = wonderbly["change_30d"]
+        latest = wonderbly["latest"]
+        direction = "stable" if change["delta"] == 0 else ("en hausse" if change["delta"] > 0 else "en baisse")
+        return (
+            f"Prix Wonderbly €{latest['low']:g}-{latest['high']:g}, {direction} "
+            f"({change['delta']:+.2f}€, {change['delta_pct'] or 0:+.1f}%) depuis le {change['from_date']}."
+        )
+    
+    def _site_fields(self, websites: list) -> dict:
+        """Fetched fields for the given websites, used as section cache inputs"""
+        
+        if not websites:
+            return {}
+        
+        from competitor_fetcher import normalize_url
+        
+        return {
+            normalize_url(site): self.site_data.get(normalize_url(site), {}).get("fields", {})
+            for site in sorted(websites)
+        }
+    
     def generate_monthly_report(self) -> dict:
         """Generate comprehensive monthly competitor report"""
         
         current_month = datetime.datetime.now().strftime("%B %Y")
+        sections = self.section_cache
+        
+        pricing_analysis = sections.get("pricing_analysis", self.collect_competitor_pricing)
+        with span("report.record_pricing_sample", "io"):
+            self.record_pricing_sample()
+        price_trends = sections.get("price_trends", self.analyze_price_trends, {
+            "history": self.price_history.fingerprint(),
+            "today": datetime.date.today()
+        })
         
         report = {
             "report_date": current_month,
             "executive_summary": """
             Marché français des livres personnalisés en croissance. Wonderbly dominant mais présente des faiblesses en localisation culturelle et délais de livraison. 
             Opportunités claires: création complète vs adaptation, niches culturelles françaises non exploitées, positionnement prix compétitif.
-            """,
-            "wonderbly_analysis": self.monitor_wonderbly_france(),
-            "local_competition": self.monitor_local_competitors(),
-            "opportunities": self.analyze_market_opportunities(),
-            "pricing_analysis": self.collect_competitor_pricing(),
+            """ + self._pricing_summary_text(price_trends),
+            "wonderbly_analysis": sections.get("wonderbly_analysis", self.monitor_wonderbly_france, {
+                "site_data": self._site_fields([url for url in self.site_data if url == WONDERBLY_FR_URL])
+            }),
+            "local_competition": sections.get("local_competition", self.monitor_local_competitors, {
+                "site_data": self._site_fields([url for url in self.site_data if url != WONDERBLY_FR_URL])
+            }),
+            "opportunities": sections.get("opportunities", self.analyze_market_opportunities),
+            "pricing_analysis": pricing_analysis,
+            "price_trends": price_trends,
             "recommendations": [
                 "Cibler niches culturelles françaises non exploitées",
                 "Positionner comme création complète vs adaptation",
@@ -201,6 +385,8 @@ class CompetitorMonitor:
             ]
         }
         
+        with span("report.save_sections", "io"):
+            sections.save()
         return report
     
     def save_report(self, report_data: dict) -> None:
@@ -209,9 +395,15 @@ class CompetitorMonitor:
         try:
             timestamp = datetime.datetime.now().isoformat()
             filename = f"/tmp/competitor_report_{timestamp[:10]}.json"
+            content = json.dumps(report_data, indent=2, default=str)
+            
+            # Skip the rewrite when nothing changed since the last run
+            if Path(filename).exists() and Path(filename).read_text() == content:
+                print(f"💾 Competitor report unchanged: {filename}")
+                return
             
             with open(filename, 'w') as f:
-                json.dump(report_data, f, indent=2, default=str)
+                f.write(content)
             
             print(f"💾 Competitor report saved: {filename}")
             
@@ -232,6 +424,17 @@ class CompetitorMonitor:
             print(f"✅ Local Competition: COMPLETE") 
             print(f"✅ Market Opportunities: COMPLETE")
             print(f"✅ Pricing Analysis: COMPLETE")
+            print(f"✅ Price Trends: {len(report['price_trends'])} series tracked")
+            
+            rebuilt = self.section_cache.rebuilt
+            print(f"♻️  Sections rebuilt: {', '.join(rebuilt) if rebuilt else 'none (all cached)'}")
+            for name, seconds in self.section_cache.build_times.items():
+                if name in rebuilt:
+                    print(f"   ⏱️  {name}: {seconds * 1000:.2f} ms (rebuilt)")
+                else:
+                    last_build = self.section_cache.sections[name]["build_seconds"]
+                    print(f"   ⏱️  {name}: {seconds * 1000:.2f} ms lookup "
+                          f"(cached, last build {last_build * 1000:.2f} ms)")
             
             # Save real data
             self.save_report(report)
@@ -251,7 +454,13 @@ class CompetitorMonitor:
             }
 
 if __name__ == "__main__":
+    import sys
+    from tracing import init_from_argv
+    
+    init_from_argv(sys.argv)
     monitor = CompetitorMonitor()
+    if "--fetch" in sys.argv:
+        monitor.refresh_competitor_sites()
     test_results = monitor.test_system_functionality()
     
     print(f"🎯 Competitor monitoring system: {test_results['status']}")
\ No newline at end of file
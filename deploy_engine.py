@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Deploy Engine
+Incremental GitHub Pages deploys: fingerprint sources, skip unchanged builds, sync docs/
+**Created**: 2026-10-19
+
+Stages:
+    build   npm run build, skipped when the source fingerprint matches the last
+            successful build and docs/ is present
+    sync    copy only new/changed files from dist/ into docs/ and delete stale
+            ones, instead of ``rm -rf docs && mv dist docs``
+    commit  git add + commit (skipped when the tree is clean)
+    push    push HEAD to its upstream, or to origin/<branch> (skipped when
+            nothing is ahead of the upstream)
+
+Per-project state (file hashes, fingerprints, last stage durations) lives in
+``~/.openclaw/deploy/``. The time saved by a skipped stage is estimated from
+its last measured run.
+
+Usage:
+    python3 deploy_engine.py <project-dir> [--force]
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from file_manifest import build_manifest, fingerprint, hash_manifest
+
+BUILD_OUTPUT = "dist"
+DEPLOY_DIR = "docs"
+# Generated or vendored paths that never count as sources
+SOURCE_SKIP_DIRS = frozenset({".git", "node_modules", ".next", BUILD_OUTPUT, DEPLOY_DIR, "out"})
+SOURCE_SKIP_SUFFIXES = (".log", ".tmp")
+
+
+class DeployError(Exception):
+    """A deploy stage failed"""
+
+
+class DeployEngine:
+    """Incremental build / sync / commit / push for one project"""
+
+    def __init__(self, project_dir: str, state_dir: Optional[Path] = None,
+                 log: Optional[Callable[[str], None]] = None):
+        self.project_dir = Path(project_dir).resolve()
+        self.name = self.project_dir.name
+        state_dir = Path(state_dir) if state_dir else Path.home() / ".openclaw" / "deploy"
+        path_hash = hashlib.sha1(str(self.project_dir).encode("utf-8")).hexdigest()[:8]
+        self.state_file = state_dir / f"{self.name}-{path_hash}.json"
+        self.log = log or print
+        self.state = self._load_state()
+        self.stages: List[dict] = []
+        self._fingerprint: Optional[str] = None
+
+    def _load_state(self) -> dict:
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {"source_manifest": {}, "durations": {}}
+
+    def save_state(self) -> None:
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self.state, f)
+        tmp_file.replace(self.state_file)
+
+    def _record(self, stage: str, status: str, seconds: float, detail: str = "") -> dict:
+        """Record a stage result; skipped stages are credited with their last real duration"""
+        durations = self.state.setdefault("durations", {})
+        saved = durations.get(stage, 0.0) if status == "skipped" else 0.0
+        if status == "done":
+            durations[stage] = round(seconds, 3)
+        result = {"stage": stage, "status": status, "seconds": round(seconds, 3),
+                  "saved_seconds": round(saved, 3), "detail": detail}
+        self.stages.append(result)
+        icon = {"done": "✅", "skipped": "⏭️ ", "failed": "❌"}.get(status, "•")
+        self.log(f"{icon} {stage}: {status} ({seconds:.2f}s){' - ' + detail if detail else ''}")
+        return result
+
+    def _run(self, cmd: List[str], check: bool = True) -> int:
+        """Run a command in the project dir, streaming its output through ``log``"""
+        process = subprocess.Popen(cmd, cwd=self.project_dir, stdout=subprocess.PIPE,
+                                   stderr=subprocess.STDOUT, text=True)
+        for line in process.stdout:
+            self.log(f"   {line.rstrip()}")
+        returncode = process.wait()
+        if check and returncode != 0:
+            raise DeployError(f"{' '.join(cmd)} exited with {returncode}")
+        return returncode
+
+    def _git(self, *args: str) -> str:
+        result = subprocess.run(["git", *args], cwd=self.project_dir, capture_output=True, text=True)
+        return result.stdout.strip() if result.returncode == 0 else ""
+
+    def is_nextjs(self) -> bool:
+        return any((self.project_dir / name).exists()
+                   for name in ("next.config.ts", "next.config.js", "next.config.mjs"))
+
+    def source_fingerprint(self) -> str:
+        """Content fingerprint of the project sources, rehashing only touched files"""
+        if self._fingerprint is None:
+            manifest = build_manifest(str(self.project_dir), SOURCE_SKIP_DIRS, SOURCE_SKIP_SUFFIXES)
+            hashed = hash_manifest(str(self.project_dir), manifest, self.state.get("source_manifest"))
+            self.state["source_manifest"] = hashed
+            self._fingerprint = fingerprint(hashed)
+        return self._fingerprint
+
+    def build(self, force: bool = False) -> dict:
+        start = time.perf_counter()
+        if not self.is_nextjs():
+            return self._record("build", "skipped", 0.0, "not a Next.js project")
+
+        current = self.source_fingerprint()
+        if (not force and current == self.state.get("built_fingerprint")
+                and (self.project_dir / DEPLOY_DIR).is_dir()):
+            return self._record("build", "skipped", time.perf_counter() - start,
+                                f"sources unchanged ({current[:12]})")
+
+        self.log("📦 Building Next.js project...")
+        try:
+            self._run(["npm", "run", "build"])
+        except (DeployError, OSError) as e:
+            self._record("build", "failed", time.perf_counter() - start, str(e))
+            raise DeployError(f"build failed: {e}") from e
+        return self._record("build", "done", time.perf_counter() - start, f"fingerprint {current[:12]}")
+
+    def sync(self) -> dict:
+        """Mirror dist/ into docs/, touching only files whose content changed"""
+        start = time.perf_counter()
+        source = self.project_dir / BUILD_OUTPUT
+        target = self.project_dir / DEPLOY_DIR
+        if not source.is_dir():
+            return self._record("sync", "skipped", time.perf_counter() - start, f"no {BUILD_OUTPUT}/ output")
+
+        try:
+            src_manifest = hash_manifest(str(source), build_manifest(str(source), (), ()))
+            dst_manifest = (hash_manifest(str(target), build_manifest(str(target), (), ()),
+                                          self.state.get("deploy_manifest"))
+                            if target.is_dir() else {})
+
+            copied = unchanged = removed = 0
+            for rel_path, entry in src_manifest.items():
+                old = dst_manifest.get(rel_path)
+                if old and old[2] == entry[2]:
+                    unchanged += 1
+                    continue
+                destination = target / rel_path
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source / rel_path, destination)
+                copied += 1
+
+            for rel_path in dst_manifest.keys() - src_manifest.keys():
+                (target / rel_path).unlink()
+                removed += 1
+            self._prune_empty_dirs(target)
+
+            shutil.rmtree(source)
+            self.state["deploy_manifest"] = hash_manifest(str(target), build_manifest(str(target), (), ()),
+                                                          {**dst_manifest, **src_manifest})
+        except OSError as e:
+            self._record("sync", "failed", time.perf_counter() - start, str(e))
+            raise DeployError(f"sync failed: {e}") from e
+
+        status = "done" if copied or removed else "skipped"
+        return self._record("sync", status, time.perf_counter() - start,
+                            f"{copied} copied, {removed} removed, {unchanged} unchanged")
+
+    @staticmethod
+    def _prune_empty_dirs(root: Path) -> None:
+        for dirpath, dirnames, filenames in os.walk(root, topdown=False):
+            if dirpath != str(root) and not dirnames and not filenames:
+                try:
+                    os.rmdir(dirpath)
+                except OSError:
+                    pass
+
+    def commit(self, message: Optional[str] = None) -> dict:
+        start = time.perf_counter()
+        if not self._git("status", "--porcelain"):
+            return self._record("commit", "skipped", time.perf_counter() - start, "working tree clean")
+        self.log("📝 Committing changes...")
+        try:
+            self._run(["git", "add", "."])
+            self._run(["git", "commit", "-m", message or f"Auto-deploy: {time.strftime('%Y-%m-%d %H:%M')}"])
+        except DeployError as e:
+            self._record("commit", "failed", time.perf_counter() - start, str(e))
+            raise
+        return self._record("commit", "done", time.perf_counter() - start)
+
+    def push(self) -> dict:
+        start = time.perf_counter()
+        ahead = self._git("rev-list", "--count", "@{upstream}..HEAD")
+        if ahead == "0":
+            return self._record("push", "skipped", time.perf_counter() - start, "remote up to date")
+
+        # Push the checked-out branch to its upstream, or to a same-named branch on origin
+        upstream = self._git("rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{upstream}")
+        if upstream:
+            remote, branch = upstream.split("/", 1)
+            cmd = ["git", "push", remote, f"HEAD:{branch}"]
+        else:
+            branch = self._git("symbolic-ref", "--short", "HEAD")
+            if not branch:
+                self._record("push", "failed", time.perf_counter() - start, "detached HEAD")
+                raise DeployError("push failed: detached HEAD and no upstream")
+            remote = "origin"
+            cmd = ["git", "push", "--set-upstream", remote, branch]
+
+        self.log("⬆️  Pushing to GitHub...")
+        if self._run(cmd, check=False) == 0:
+            return self._record("push", "done", time.perf_counter() - start, f"{remote}/{branch}")
+        self._record("push", "failed", time.perf_counter() - start, "git push failed")
+        raise DeployError("push failed")
+
+    def prepare(self, force: bool = False, build: bool = True, message: Optional[str] = None) -> None:
+        """Local stages (build, sync, commit); raises DeployError on failure"""
+        if build and self.build(force)["status"] == "done":
+            self.sync()
+            self.state["built_fingerprint"] = self.source_fingerprint()
+            self.save_state()
+        self.commit(message)
+
+    def deploy(self, force: bool = False) -> dict:
+        """Run every stage; stops at the first failing stage"""
+        self.log(f"🚀 Starting deployment for: {self.name}")
+        self.log(f"📁 Project directory: {self.project_dir}")
+        ok = True
+        try:
+            self.prepare(force)
+            self.push()
+        except DeployError as e:
+            self.log(f"❌ {e}")
+            ok = False
+        finally:
+            self.save_state()
+        return self.summary(ok)
+
+    def summary(self, ok: bool = True) -> dict:
+        return {
+            "project": self.name,
+            "ok": ok,
+            "stages": self.stages,
+            "seconds": round(sum(s["seconds"] for s in self.stages), 3),
+            "saved_seconds": round(sum(s["saved_seconds"] for s in self.stages), 3)
+        }
+
+
+def print_summary(summary: dict) -> None:
+    print("")
+    print(f"{'stage':<10}{'status':<10}{'time':>9}{'saved':>9}  detail")
+    print("-" * 72)
+    for stage in summary["stages"]:
+        print(f"{stage['stage']:<10}{stage['status']:<10}{stage['seconds']:>8.2f}s"
+              f"{stage['saved_seconds']:>8.2f}s  {stage['detail']}")
+    print("-" * 72)
+    print(f"{'total':<20}{summary['seconds']:>8.2f}s{summary['saved_seconds']:>8.2f}s")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if not args:
+        print("Usage: deploy_engine.py <project-dir> [--force]")
+        sys.exit(1)
+
+    engine = DeployEngine(args[0])
+    result = engine.deploy(force="--force" in sys.argv)
+    print_summary(result)
+    if result["ok"]:
+        print(f"✅ Deployment complete for {engine.name}!")
+        print("🌐 Site will be live in 2-3 minutes")
+    sys.exit(0 if result["ok"] else 1)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Deploy Orchestrator
+Batch deploys across many projects: concurrent builds, concurrent pushes, isolated failures
+**Created**: 2026-10-19
+
+Local stages (build, sync, commit) run on a pool bounded by the CPU count;
+each project is handed to a separate push pool as soon as its local stages
+finish, so network pushes overlap with other projects' builds. Output is
+streamed line by line with a ``[project]`` prefix and also written to
+``~/.openclaw/deploy/logs/<project>.log``. A failing project is reported in
+the summary without stopping the others.
+
+Usage:
+    python3 deploy_orchestrator.py                    # every repo in ProjectStatusReporter.GITHUB_REPOS
+    python3 deploy_orchestrator.py site-a site-b      # named projects (workspace name or path)
+    python3 deploy_orchestrator.py --force --jobs 2
+    python3 deploy_orchestrator.py --skip-build -m "message" <repo-dir>...   # batch commit + push
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from deploy_engine import DeployEngine, DeployError
+
+WORKSPACE = "/home/node/.openclaw/workspace"
+STAGES = ("build", "sync", "commit", "push")
+PUSH_WORKERS = 8
+
+
+def resolve_project(name: str, workspace: str = WORKSPACE) -> Optional[Path]:
+    """Map a project name to its directory the same way auto-deploy.sh does"""
+    if os.sep in name or Path(name).is_dir():
+        path = Path(name)
+        return path if path.is_dir() else None
+    for root in ("brands", "projects"):
+        path = Path(workspace) / root / name
+        if path.is_dir():
+            return path
+    return None
+
+
+def default_projects() -> List[str]:
+    from tool_registry import tool_class
+
+    return [name for name, _ in tool_class("status").GITHUB_REPOS]
+
+
+class DeployOrchestrator:
+    """Deploy several projects concurrently and summarize per-stage timings"""
+
+    def __init__(self, projects: List[str], workspace: str = WORKSPACE, jobs: Optional[int] = None,
+                 log_dir: Optional[Path] = None):
+        self.projects = projects
+        self.workspace = workspace
+        self.jobs = jobs or os.cpu_count() or 1
+        self.log_dir = Path(log_dir) if log_dir else Path.home() / ".openclaw" / "deploy" / "logs"
+        self._print_lock = threading.Lock()
+        self.results: Dict[str, dict] = {}
+
+    def _logger(self, project: str):
+        """Line logger that prefixes output on the console and tees it to a log file"""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = open(self.log_dir / f"{Path(project).name}.log", "a", buffering=1)
+        log_file.write(f"--- {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
+        width = max(len(p) for p in self.projects)
+
+        def log(line: str) -> None:
+            with self._print_lock:
+                print(f"[{project:<{width}}] {line}", flush=True)
+            log_file.write(line + "\n")
+
+        log.close = log_file.close
+        return log
+
+    def _prepare(self, project: str, force: bool, build: bool, message: Optional[str]):
+        log = self._logger(project)
+        start = time.perf_counter()
+        path = resolve_project(project, self.workspace)
+        if path is None:
+            return project, None, log, start, "project not found"
+
+        engine = DeployEngine(str(path), log=log)
+        try:
+            engine.prepare(force=force, build=build, message=message)
+            return project, engine, log, start, None
+        except (DeployError, OSError) as e:
+            log(f"❌ {e}")
+            return project, engine, log, start, str(e)
+        except Exception as e:  # a bug in one project's deploy must not hide it from the summary
+            log(f"❌ {type(e).__name__}: {e}")
+            return project, engine, log, start, f"{type(e).__name__}: {e}"
+
+    def _push(self, project: str, engine: DeployEngine, log, start: float) -> None:
+        try:
+            engine.push()
+            self._finish(project, engine, log, start, None)
+        except (DeployError, OSError) as e:
+            log(f"❌ {e}")
+            self._finish(project, engine, log, start, str(e))
+        except Exception as e:
+            log(f"❌ {type(e).__name__}: {e}")
+            self._finish(project, engine, log, start, f"{type(e).__name__}: {e}")
+
+    def _finish(self, project: str, engine: Optional[DeployEngine], log, start: float,
+                error: Optional[str]) -> None:
+        if engine is not None:
+            engine.save_state()
+        self.results[project] = {
+            "project": project,
+            "ok": error is None,
+            "error": error,
+            "stages": {s["stage"]: s for s in engine.stages} if engine else {},
+            "wall_seconds": round(time.perf_counter() - start, 3)
+        }
+        log("✅ Done" if error is None else f"❌ Failed: {error}")
+        log.close()
+
+    def run(self, force: bool = False, build: bool = True, message: Optional[str] = None) -> Dict[str, dict]:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=PUSH_WORKERS, thread_name_prefix="push") as push_pool:
+            with ThreadPoolExecutor(max_workers=self.jobs, thread_name_prefix="build") as build_pool:
+                for project in self.projects:
+                    future = build_pool.submit(self._prepare, project, force, build, message)
+                    future.add_done_callback(lambda f, p=project: self._after_prepare(p, f, push_pool))
+        self.wall_seconds = time.perf_counter() - start
+        return self.results
+
+    def _after_prepare(self, project: str, future, push_pool: ThreadPoolExecutor) -> None:
+        # Runs as a done-callback, where an exception would be logged and dropped
+        try:
+            _, engine, log, start, error = future.result()
+            if error is None:
+                push_pool.submit(self._push, project, engine, log, start)
+            else:
+                self._finish(project, engine, log, start, error)
+        except Exception as e:
+            with self._print_lock:
+                print(f"[{project}] ❌ {type(e).__name__}: {e}", flush=True)
+            self.results[project] = {"project": project, "ok": False, "error": f"{type(e).__name__}: {e}",
+                                     "stages": {}, "wall_seconds": 0.0}
+
+    def print_summary(self) -> None:
+        print("")
+        print("📦 DEPLOY SUMMARY")
+        header = f"{'project':<24}" + "".join(f"{s:>10}" for s in STAGES) + f"{'wall':>10}  status"
+        print("=" * len(header))
+        print(header)
+        print("-" * len(header))
+        for project in self.projects:
+            result = self.results.get(project, {"ok": False, "error": "not run", "stages": {}, "wall_seconds": 0})
+            cells = []
+            for stage in STAGES:
+                entry = result["stages"].get(stage)
+                if entry is None:
+                    cells.append(f"{'-':>10}")
+                elif entry["status"] == "skipped":
+                    cells.append(f"{'skip':>10}")
+                else:
+                    cells.append(f"{entry['seconds']:>9.2f}s")
+            status = "✅" if result["ok"] else f"❌ {result['error']}"
+            print(f"{project:<24}" + "".join(cells) + f"{result['wall_seconds']:>9.2f}s  {status}")
+        print("-" * len(header))
+
+        serial = sum(r["wall_seconds"] for r in self.results.values())
+        failed = sum(1 for r in self.results.values() if not r["ok"])
+        print(f"Wall time: {self.wall_seconds:.2f}s (sequential would be ~{serial:.2f}s), "
+              f"{len(self.results) - failed}/{len(self.projects)} succeeded")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    options = {"force": False, "build": True, "message": None, "jobs": None}
+    projects = []
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg == "--force":
+            options["force"] = True
+        elif arg == "--skip-build":
+            options["build"] = False
+        elif arg in ("-m", "--message"):
+            i += 1
+            options["message"] = args[i]
+        elif arg in ("-j", "--jobs"):
+            i += 1
+            options["jobs"] = int(args[i])
+        else:
+            projects.append(arg)
+        i += 1
+
+    orchestrator = DeployOrchestrator(projects or default_projects(), jobs=options["jobs"])
+    results = orchestrator.run(force=options["force"], build=options["build"], message=options["message"])
+    orchestrator.print_summary()
+    sys.exit(0 if all(r["ok"] for r in results.values()) else 1)
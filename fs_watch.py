@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Filesystem Watch
+Change events for workspace project trees: inotify via ctypes, polling fallback
+**Created**: 2026-10-19
+
+Both watchers report changes the same way: ``wait(timeout)`` returns
+``{root: set of relative paths}`` for the roots that changed, where a path
+may be a file or a directory (created, removed or moved), or ``{root: None}``
+when the root has to be rescanned (event queue overflow, root removed).
+Directories and files skipped by ``file_manifest`` (``.git``,
+``node_modules``, ``*.log`` ...) never produce events.
+"""
+
+import os
+import time
+from typing import Dict, Iterable, Optional, Set
+
+from file_manifest import SKIP_DIRS, SKIP_SUFFIXES, build_manifest
+
+# <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_EXCL_UNLINK = 0x04000000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = (IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+              | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW | IN_EXCL_UNLINK)
+
+Changes = Dict[str, Optional[Set[str]]]
+
+
+def _merge(changes: Changes, root: str, rel_path: Optional[str]) -> None:
+    if rel_path is None or changes.get(root, ()) is None:
+        changes[root] = None
+    else:
+        changes.setdefault(root, set()).add(rel_path)
+
+
+def _skipped(name: str, is_dir: bool) -> bool:
+    return name in SKIP_DIRS if is_dir else name.endswith(SKIP_SUFFIXES)
+
+
+class InotifyWatcher:
+    """Recursive inotify watches on a set of roots (Linux only)"""
+
+    def __init__(self, roots: Iterable[str] = ()):
+        import ctypes
+        import ctypes.util
+        import struct
+
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._ctypes = ctypes
+        self._event = struct.Struct("iIII")  # wd, mask, cookie, len
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs = {}  # wd -> (root, relative dir)
+        self._wds = {}   # (root, relative dir) -> wd
+        try:
+            for root in roots:
+                self.add(root)
+        except Exception:
+            self.close()
+            raise
+
+    def add(self, root: str) -> None:
+        """Watch ``root`` and every directory below it"""
+        self._watch_tree(root, "")
+
+    def _watch_tree(self, root: str, rel_dir: str) -> None:
+        stack = [rel_dir]
+        while stack:
+            rel_dir = stack.pop()
+            self._watch_dir(root, rel_dir)
+            try:
+                entries = os.scandir(os.path.join(root, rel_dir))
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False) and not _skipped(entry.name, True):
+                            stack.append(f"{rel_dir}/{entry.name}" if rel_dir else entry.name)
+                    except OSError:
+                        continue
+
+    def _watch_dir(self, root: str, rel_dir: str) -> None:
+        path = os.path.join(root, rel_dir).encode("utf-8", "surrogateescape")
+        wd = self._libc.inotify_add_watch(self.fd, path, WATCH_MASK)
+        if wd < 0:
+            errno = self._ctypes.get_errno()
+            if errno in (2, 20):  # ENOENT, ENOTDIR: gone before we got to it
+                return
+            raise OSError(errno, f"inotify_add_watch failed for {path.decode('utf-8', 'replace')}")
+        old = self._dirs.get(wd)
+        if old is not None:  # same inode watched again after a move
+            self._wds.pop(old, None)
+        self._dirs[wd] = (root, rel_dir)
+        self._wds[(root, rel_dir)] = wd
+
+    def _unwatch_tree(self, root: str, rel_dir: str) -> None:
+        prefix = rel_dir + "/"
+        for key in [k for k in self._wds if k[0] == root and (k[1] == rel_dir or k[1].startswith(prefix))]:
+            wd = self._wds.pop(key)
+            self._dirs.pop(wd, None)
+            self._libc.inotify_rm_watch(self.fd, wd)
+
+    def wait(self, timeout: float = None) -> Changes:
+        """Block up to ``timeout`` seconds for events; returns the changes read"""
+        import select
+
+        changes = {}
+        if select.select([self.fd], [], [], timeout)[0]:
+            while True:
+                try:
+                    buffer = os.read(self.fd, 1 << 16)
+                except BlockingIOError:
+                    break
+                self._parse(buffer, changes)
+        return changes
+
+    def _parse(self, buffer: bytes, changes: Changes) -> None:
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _cookie, length = self._event.unpack_from(buffer, offset)
+            offset += self._event.size
+            name = buffer[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                for root in {root for root, _ in self._wds}:
+                    _merge(changes, root, None)
+                continue
+            where = self._dirs.get(wd)
+            if where is None:
+                continue
+            root, rel_dir = where
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                self._wds.pop(where, None)
+                if rel_dir == "":
+                    _merge(changes, root, None)
+                continue
+            if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+                if rel_dir == "":
+                    _merge(changes, root, None)
+                continue  # subdirectories are reported by their parent
+
+            is_dir = bool(mask & IN_ISDIR)
+            if not name or _skipped(name, is_dir):
+                continue
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            if is_dir:
+                if mask & IN_MOVED_FROM:
+                    self._unwatch_tree(root, rel_path)
+                elif mask & (IN_CREATE | IN_MOVED_TO):
+                    self._watch_tree(root, rel_path)
+            _merge(changes, root, rel_path)
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class PollingWatcher:
+    """Portable fallback: rescans each root's manifest every ``interval`` seconds"""
+
+    def __init__(self, roots: Iterable[str] = (), interval: float = 2.0):
+        self.interval = interval
+        self._manifests = {}
+        for root in roots:
+            self.add(root)
+
+    def add(self, root: str) -> None:
+        self._manifests[root] = build_manifest(root)
+
+    def wait(self, timeout: float = None) -> Changes:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changes = self.scan()
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if changes or (remaining is not None and remaining <= 0):
+                return changes
+            time.sleep(self.interval if remaining is None else min(self.interval, remaining))
+
+    def scan(self) -> Changes:
+        changes = {}
+        for root, old in self._manifests.items():
+            new = build_manifest(root) if os.path.isdir(root) else {}
+            if new != old:
+                changed = {p for p in new.keys() | old.keys() if new.get(p) != old.get(p)}
+                changes[root] = changed if new else None
+                self._manifests[root] = new
+        return changes
+
+    def close(self) -> None:
+        self._manifests.clear()
+
+
+def open_watcher(roots: Iterable[str], poll_interval: float = 2.0, polling: bool = False):
+    """inotify watcher where the platform supports it, otherwise the polling watcher"""
+    roots = list(roots)
+    if not polling:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError) as e:  # no libc inotify, or watch limit reached
+            print(f"⚠️  inotify unavailable ({e}); polling every {poll_interval:g}s")
+    return PollingWatcher(roots, poll_interval)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+HTTP Policy
+Adaptive per-host timeouts from observed latency, and hedged idempotent probes
+**Created**: 2026-10-19
+
+Every outbound call records how long its host took. Once a host has
+``MIN_SAMPLES`` observations its deadline becomes ``p99 * 3 + 0.25s``
+(never below ``FLOOR`` or above the caller's old fixed timeout), so a fast
+host that hangs is given up on in a second or two instead of 10-30s. Each
+consecutive timeout doubles the host's deadline again (up to the fixed
+ceiling), so a host that has simply become slower isn't failed repeatedly.
+The trade-off is that a response slower than three times anything seen
+recently is treated as a failure; for GETs the hedge below covers that.
+
+Idempotent GET probes can be hedged: when the first attempt is still running
+after the host's p95, an identical backup attempt starts, and whichever
+answers first wins. The backup only gets the remaining budget, so a hedged
+call never waits longer than an unhedged one and fails only if both do.
+
+Latency windows persist in ``~/.openclaw/http_latency.json`` (override with
+``OPENCLAW_HTTP_STATS``) so short-lived CLI runs start with warm estimates.
+
+    policy = default_policy()
+    timeout = policy.timeout_for(url, 10)
+    status = policy.request(url, lambda t: probe(url, t), timeout, hedge=True)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+WINDOW = 100          # latency samples kept per host
+MIN_SAMPLES = 20      # fixed timeout until a host has this many (p99 = slowest seen)
+TIMEOUT_PERCENTILE = 99
+TIMEOUT_MULTIPLIER = 3.0
+TIMEOUT_SLACK = 0.25  # seconds, absorbs scheduling jitter on very fast hosts
+FLOOR = 1.0
+HEDGE_PERCENTILE = 95
+MAX_BACKOFF = 4       # consecutive timeouts that still double the deadline
+SAVE_INTERVAL = 5.0   # seconds between state writes while observations arrive
+
+
+def host_of(url: str) -> str:
+    """``host[:port]`` of a URL (cheaper than urllib.parse on hot paths)"""
+    rest = url.split("://", 1)[-1]
+    return rest.split("/", 1)[0].rsplit("@", 1)[-1].lower()
+
+
+def percentile(samples: list, pct: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(samples)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[int(rank) - 1]
+
+
+class HttpPolicy:
+    """Per-host latency windows and the timeouts / hedge delays derived from them"""
+
+    def __init__(self, state_file=None, hedging: bool = True):
+        state_file = state_file or os.environ.get("OPENCLAW_HTTP_STATS")
+        self.state_file = Path(state_file) if state_file else Path.home() / ".openclaw" / "http_latency.json"
+        self._hosts = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._flush_at_exit = False
+        self._saved_at = float("-inf")
+        self.hedging = hedging
+        self.hedges = 0
+        self.hedge_wins = 0
+
+    @property
+    def hosts(self) -> dict:
+        """{host: {"latencies": [seconds, ...], "timeouts": consecutive count}}"""
+        if self._hosts is None:
+            try:
+                with open(self.state_file, "r") as f:
+                    self._hosts = json.load(f)
+            except (OSError, ValueError):
+                self._hosts = {}
+        return self._hosts
+
+    def _stats(self, url: str) -> dict:
+        return self.hosts.setdefault(host_of(url), {"latencies": [], "timeouts": 0})
+
+    def timeout_for(self, url: str, default: float) -> float:
+        """Deadline for the next call to ``url``'s host; ``default`` is the ceiling"""
+        with self._lock:
+            stats = self.hosts.get(host_of(url))
+            if not stats or len(stats["latencies"]) < MIN_SAMPLES:
+                return default
+            timeout = percentile(stats["latencies"], TIMEOUT_PERCENTILE) * TIMEOUT_MULTIPLIER + TIMEOUT_SLACK
+            timeout = max(FLOOR, timeout) * 2 ** stats["timeouts"]
+        return min(default, timeout)
+
+    def hedge_delay(self, url: str) -> float | None:
+        """How long to wait before a backup attempt, or None until the host has enough samples"""
+        with self._lock:
+            stats = self.hosts.get(host_of(url))
+            if not stats or len(stats["latencies"]) < MIN_SAMPLES:
+                return None
+            return percentile(stats["latencies"], HEDGE_PERCENTILE)
+
+    def observe(self, url: str, seconds: float) -> None:
+        """Record a completed call (any HTTP status: the host answered)"""
+        with self._lock:
+            stats = self._stats(url)
+            stats["latencies"].append(round(seconds, 4))
+            del stats["latencies"][:-WINDOW]
+            stats["timeouts"] = 0
+            self._touched()
+
+    def observe_timeout(self, url: str) -> None:
+        with self._lock:
+            stats = self._stats(url)
+            stats["timeouts"] = min(MAX_BACKOFF, stats["timeouts"] + 1)
+            self._touched()
+
+    def _touched(self) -> None:
+        if not self._dirty:
+            self._dirty = True
+            if not self._flush_at_exit:
+                import atexit
+                atexit.register(self.save)  # flush whatever the save throttle held back
+                self._flush_at_exit = True
+        if time.monotonic() - self._saved_at >= SAVE_INTERVAL:
+            self.save()
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                self.state_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self.state_file.with_suffix(".tmp")
+                with open(tmp_file, "w") as f:
+                    json.dump(self.hosts, f)
+                tmp_file.replace(self.state_file)
+                self._dirty = False
+            except OSError as e:
+                print(f"Warning: Could not save HTTP latency stats: {e}")
+            self._saved_at = time.monotonic()
+
+    def _timed(self, url: str, attempt, timeout: float, timeout_errors: tuple):
+        start = time.perf_counter()
+        try:
+            result = attempt(timeout)
+        except timeout_errors:
+            self.observe_timeout(url)
+            raise
+        self.observe(url, time.perf_counter() - start)
+        return result
+
+    def request(self, url: str, attempt, timeout: float, hedge: bool = False,
+                timeout_errors: tuple = (TimeoutError,)):
+        """Run ``attempt(timeout)`` and record its latency (or timeout) for ``url``'s host
+
+        With ``hedge=True`` (idempotent requests only) a backup attempt starts
+        once the first has run for the host's p95; the first result wins.
+        """
+        delay = self.hedge_delay(url) if hedge and self.hedging else None
+        if delay is None or delay >= timeout:
+            return self._timed(url, attempt, timeout, timeout_errors)
+
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="hedge")
+        try:
+            first = pool.submit(self._timed, url, attempt, timeout, timeout_errors)
+            done, _ = wait([first], timeout=delay)
+            if done:
+                return first.result()
+
+            backup = pool.submit(self._timed, url, attempt, max(timeout - delay, FLOOR / 10), timeout_errors)
+            with self._lock:
+                self.hedges += 1
+            pending = {first, backup}
+            error = None
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future.exception() is None:
+                        if future is backup:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return future.result()
+                    error = error or future.exception()
+            raise error
+        finally:
+            pool.shutdown(wait=False)  # a losing attempt finishes on its own deadline
+
+
+_default = None
+
+
+def default_policy() -> HttpPolicy:
+    """Process-wide policy shared by every tool (and every tool hosted by the daemon)"""
+    global _default
+    if _default is None:
+        _default = HttpPolicy()
+    return _default
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Client
+Thin CLI for the OpenClaw daemon - forwards a tool method call over the Unix socket
+**Created**: 2026-10-19
+
+Deliberately imports nothing beyond the standard socket/json modules so each
+invocation costs little more than interpreter startup.
+
+Usage:
+    ./openclaw-client.py <tool> <method> [args...]
+    ./openclaw-client.py tracker start_session livre-magique content
+    ./openclaw-client.py broadcaster broadcast_progress_update "Site" "Deployed" 80
+    ./openclaw-client.py ping | status | reload [tool] | stop
+
+Arguments that parse as JSON (numbers, true/false, lists) are sent decoded;
+everything else is sent as a string.
+"""
+
+import json
+import os
+import socket
+import sys
+
+SOCKET_PATH = os.environ.get("OPENCLAW_SOCKET", os.path.expanduser("~/.openclaw/daemon.sock"))
+DAEMON_METHODS = {"ping": "ping", "status": "status", "reload": "reload", "stop": "shutdown"}
+
+
+def parse_arg(value: str):
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def main(argv: list) -> int:
+    if not argv:
+        print(__doc__.split("Usage:", 1)[1].rstrip())
+        return 1
+
+    if argv[0] in DAEMON_METHODS:
+        payload = {"method": DAEMON_METHODS[argv[0]], "args": argv[1:]}
+    elif len(argv) >= 2:
+        payload = {"tool": argv[0], "method": argv[1], "args": [parse_arg(a) for a in argv[2:]]}
+    else:
+        print(f"❌ Missing method for tool: {argv[0]}")
+        return 1
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(SOCKET_PATH)
+            client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with client.makefile("rb") as reader:
+                line = reader.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        print(f"❌ OpenClaw daemon not running. Start it with: python3 openclaw_daemon.py serve &")
+        return 1
+
+    if not line.strip() and payload["method"] == "shutdown":
+        response = {"ok": True, "result": "shutting down"}  # the daemon exited before replying
+    else:
+        response = json.loads(line)
+
+    if response.get("output"):
+        sys.stdout.write(response["output"])
+    if not response["ok"]:
+        print(f"❌ {response['error']}")
+        return 1
+
+    result = response["result"]
+    if isinstance(result, str):
+        print(result)
+    elif result is not None:
+        print(json.dumps(result, indent=2, ensure_ascii=False, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
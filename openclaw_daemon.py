@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Daemon
+Long-running host for the OpenClaw tools with warm state and a Unix-socket RPC
+**Created**: 2026-10-19
+
+The daemon keeps one instance of each tool alive (loaded data files, pooled
+HTTP sessions, already-imported modules) and serves newline-delimited JSON
+requests on a Unix socket:
+
+    {"tool": "tracker", "method": "start_session", "args": ["proj", "dev"]}
+    -> {"ok": true, "result": "...", "output": "<captured stdout>"}
+
+Built-in methods (tool omitted): ping, status, reload, shutdown. Tool
+methods must be listed in RPC_METHODS; anything that writes to a
+caller-chosen path or blocks indefinitely (``status.write_report``,
+``status.watch``) stays CLI-only.
+
+A warm instance is rebuilt only when the storage collections it declares in
+``STORAGE_KEYS`` (or its legacy data file) change behind the daemon's back,
+so one tool's writes don't discard the other tools' warm state.
+
+Usage:
+    python3 openclaw_daemon.py serve [--preload]
+    python3 openclaw_daemon.py status | stop
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from tool_registry import TOOLS, tool_class
+
+SOCKET_PATH = Path(os.environ.get("OPENCLAW_SOCKET", Path.home() / ".openclaw" / "daemon.sock"))
+
+# Methods callable over RPC, per tool
+RPC_METHODS = {
+    "tracker": {"start_session", "end_session", "get_stats", "report"},
+    "broadcaster": {"broadcast_progress_update", "broadcast_progress_updates",
+                    "broadcast_collaboration_invitation", "test_system_functionality"},
+    "leads": {"generate_real_leads", "test_system_functionality"},
+    "competitors": {"refresh_competitor_sites", "monitor_wonderbly_france", "monitor_local_competitors",
+                    "analyze_market_opportunities", "collect_competitor_pricing", "analyze_price_trends",
+                    "generate_monthly_report", "save_report", "test_system_functionality"},
+    "status": {"run", "check_github_repos", "check_local_projects", "check_pending_pushes"},
+}
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """stdout proxy that captures prints per request thread, passing others through"""
+
+    def __init__(self, target):
+        self.target = target
+        self.local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.target).write(text)
+
+    def flush(self):
+        self.target.flush()
+
+    def capture(self) -> io.StringIO:
+        self.local.buffer = io.StringIO()
+        return self.local.buffer
+
+    def release(self) -> str:
+        buffer = self.local.__dict__.pop("buffer", None)
+        return buffer.getvalue() if buffer else ""
+
+
+class ToolHost:
+    """Warm tool instances, recreated when their stored data changes behind the daemon's back"""
+
+    def __init__(self):
+        self.instances: Dict[str, object] = {}
+        self.data_mtimes: Dict[str, Optional[tuple]] = {}
+        self.locks = {name: threading.Lock() for name in TOOLS}
+        self.calls = {name: 0 for name in TOOLS}
+        self.started = time.time()
+
+    @staticmethod
+    def _data_mtime(instance) -> Optional[tuple]:
+        """Change token for a tool's state: legacy data file mtime plus the storage keys it reads"""
+        data_file = getattr(instance, "data_file", None)
+        try:
+            mtime = Path(data_file).stat().st_mtime_ns if data_file else None
+        except OSError:
+            mtime = None
+        storage = getattr(instance, "_storage", None)
+        if storage is None:
+            return mtime, None
+        keys = getattr(instance, "STORAGE_KEYS", None)
+        return mtime, storage.changes(keys) if keys else storage.version()
+
+    @staticmethod
+    def _retire(instance) -> None:
+        """Release what a replaced instance holds open"""
+        for attribute in ("_storage", "_session"):
+            resource = getattr(instance, attribute, None)
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception as e:
+                    print(f"⚠️  Could not close {attribute} of {type(instance).__name__}: {e}", file=sys.stderr)
+
+    def instance(self, name: str):
+        """Return the warm instance of a tool (caller holds the tool lock)"""
+        instance = self.instances.get(name)
+        if instance is not None and self._data_mtime(instance) != self.data_mtimes.get(name):
+            self._retire(instance)  # another process wrote data this tool reads; reload it
+            instance = None
+        if instance is None:
+            instance = tool_class(name)()
+            self.instances[name] = instance
+            self.data_mtimes[name] = self._data_mtime(instance)
+        return instance
+
+    def call(self, name: str, method: str, args: list, kwargs: dict):
+        if name not in TOOLS:
+            raise KeyError(f"Unknown tool: {name}")
+        if method not in RPC_METHODS.get(name, ()):
+            raise PermissionError(f"{name}.{method} is not callable over RPC")
+
+        with self.locks[name]:
+            instance = self.instance(name)
+            target = getattr(instance, method, None)
+            if not callable(target):
+                raise AttributeError(f"{TOOLS[name][1]} has no method {method}")
+            try:
+                return target(*args, **kwargs)
+            finally:
+                self.calls[name] += 1
+                self.data_mtimes[name] = self._data_mtime(instance)
+
+    def preload(self) -> None:
+        """Create every tool instance and open HTTP sessions ahead of the first request"""
+        for name in TOOLS:
+            with self.locks[name]:
+                try:
+                    instance = self.instance(name)
+                    if hasattr(type(instance), "session"):
+                        instance.session
+                except Exception as e:
+                    print(f"⚠️  Could not preload {name}: {e}", file=sys.stderr)
+
+    def reload(self, name: Optional[str] = None) -> list:
+        names = [name] if name else list(TOOLS)
+        for tool in names:
+            with self.locks[tool]:
+                instance = self.instances.pop(tool, None)
+                if instance is not None:
+                    self._retire(instance)
+        return names
+
+    def status(self) -> dict:
+        return {
+            "pid": os.getpid(),
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "socket": str(SOCKET_PATH),
+            "loaded": sorted(self.instances),
+            "calls": self.calls
+        }
+
+
+class RPCHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line, one JSON response per line"""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self.server.dispatch(line)
+            self.wfile.write(json.dumps(response, default=str, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if self.server.stopping.is_set():
+                # Only now that the reply is out: handler threads are daemons and die with the process
+                threading.Thread(target=self.server.shutdown).start()
+                return
+
+
+class OpenClawDaemon(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: Path = SOCKET_PATH):
+        self.socket_path = Path(socket_path)
+        self.host = ToolHost()
+        self.stdout = _ThreadLocalStdout(sys.stdout)
+        self.stopping = threading.Event()
+        self._prepare_socket()
+        # The socket is created owner-only by bind(); a chmod afterwards would leave a window
+        umask = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), RPCHandler)
+        finally:
+            os.umask(umask)
+
+    def _prepare_socket(self) -> None:
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self.socket_path.exists():
+            return
+        # Refuse to steal the socket from a live daemon; clear a stale one
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+            raise RuntimeError(f"Daemon already running on {self.socket_path}")
+        except (ConnectionRefusedError, FileNotFoundError):
+            self.socket_path.unlink()
+        finally:
+            probe.close()
+
+    def dispatch(self, line: bytes) -> dict:
+        start = time.perf_counter()
+        self.stdout.capture()
+        try:
+            request = json.loads(line)
+            result = self._route(request)
+            response = {"ok": True, "result": result}
+        except Exception as e:
+            response = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        response["output"] = self.stdout.release()
+        response["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return response
+
+    def _route(self, request: dict):
+        method = request.get("method", "")
+        tool = request.get("tool")
+        if tool is None:
+            if method == "ping":
+                return "pong"
+            if method == "status":
+                return self.host.status()
+            if method == "reload":
+                return self.host.reload(*request.get("args", []))
+            if method == "shutdown":
+                self.stopping.set()  # the handler shuts the server down after replying
+                return "shutting down"
+            raise ValueError(f"Unknown daemon method: {method}")
+        return self.host.call(tool, method, request.get("args", []), request.get("kwargs", {}))
+
+    def serve(self, preload: bool = False) -> None:
+        sys.stdout = self.stdout
+        if preload:
+            self.host.preload()
+        print(f"🦀 OpenClaw daemon listening on {self.socket_path} (pid {os.getpid()})", file=sys.stderr)
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sys.stdout = self.stdout.target
+            self.server_close()
+            try:
+                self.socket_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def request(payload: dict, socket_path: Path = SOCKET_PATH, timeout: float = 300.0) -> dict:
+    """Send one RPC request to a running daemon and return its response"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(str(socket_path))
+        client.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with client.makefile("rb") as reader:
+            line = reader.readline()
+    if not line.strip() and payload.get("method") == "shutdown":
+        return {"ok": True, "result": "shutting down"}  # the daemon exited before replying
+    return json.loads(line)
+
+
+if __name__ == "__main__":
+    command = sys.argv[1] if len(sys.argv) > 1 else "serve"
+
+    if command == "serve":
+        try:
+            OpenClawDaemon().serve(preload="--preload" in sys.argv)
+        except RuntimeError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+    elif command in ("status", "stop"):
+        try:
+            response = request({"method": "status" if command == "status" else "shutdown"})
+        except (FileNotFoundError, ConnectionRefusedError):
+            print(f"❌ Daemon not running ({SOCKET_PATH})")
+            sys.exit(1)
+        print(json.dumps(response["result"], indent=2))
+    else:
+        print("Usage: openclaw_daemon.py [serve [--preload]|status|stop]")
+        sys.exit(1)
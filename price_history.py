@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Competitor Price History for Livre Magique
+Compact columnar time-series store of parsed competitor price points
+**Created**: 2026-10-19
+
+Each (competitor, tier) series is kept as three parallel ``array`` columns
+(day ordinal, low price, high price) sorted by day, so range queries are a
+pair of binary searches plus a slice. The whole store is persisted as one
+binary file: a small JSON header followed by the raw column bytes. Days
+are stored as fixed 64-bit integers so files move between platforms.
+"""
+
+import datetime
+import json
+import re
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+MAGIC = b"OCPH"
+VERSION = 2
+DAY_TYPECODES = {1: "l", 2: "q"}  # version 1 used the platform-sized "l"
+HEADER = struct.Struct("<4sHI")  # magic, version, header length
+
+PRICE_PATTERN = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+
+def parse_price_range(text: str) -> Optional[Tuple[float, float]]:
+    """Parse strings like "€25-45", "€45" or "29,90 €" into (low, high)"""
+    values = [float(v.replace(",", ".")) for v in PRICE_PATTERN.findall(text or "")]
+    if not values:
+        return None
+    return min(values), max(values)
+
+
+def to_day(value) -> int:
+    """Convert a date, ISO string or day ordinal to a day ordinal"""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = datetime.date.fromisoformat(value[:10])
+    if isinstance(value, datetime.datetime):
+        value = value.date()
+    return value.toordinal()
+
+
+class PriceSeries:
+    """Sorted columns of daily price samples for one competitor and tier"""
+
+    __slots__ = ("days", "low", "high")
+
+    def __init__(self):
+        self.days = array("q")
+        self.low = array("d")
+        self.high = array("d")
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    def add(self, day: int, low: float, high: float) -> bool:
+        """Insert a sample, replacing any existing sample for the same day
+
+        Returns False when an identical sample was already stored.
+        """
+        if not self.days or day > self.days[-1]:
+            self.days.append(day)
+            self.low.append(low)
+            self.high.append(high)
+            return True
+
+        i = bisect_left(self.days, day)
+        if i < len(self.days) and self.days[i] == day:
+            if self.low[i] == low and self.high[i] == high:
+                return False
+            self.low[i] = low
+            self.high[i] = high
+        else:
+            self.days.insert(i, day)
+            self.low.insert(i, low)
+            self.high.insert(i, high)
+        return True
+
+    def bounds(self, start: Optional[int] = None, end: Optional[int] = None) -> Tuple[int, int]:
+        """Index slice [lo, hi) of samples with start <= day <= end"""
+        lo = 0 if start is None else bisect_left(self.days, start)
+        hi = len(self.days) if end is None else bisect_right(self.days, end)
+        return lo, hi
+
+
+class PriceHistory:
+    """Time-series store of competitor price points keyed by competitor and product tier"""
+
+    def __init__(self, data_file: Optional[Path] = None):
+        self.data_file = Path(data_file) if data_file else Path.home() / ".openclaw" / "competitor_prices.bin"
+        self.series: Dict[Tuple[str, str], PriceSeries] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        """Read the store; an unreadable or truncated file is reported and ignored"""
+        if not self.data_file.exists():
+            return
+        try:
+            self.series = self._read()
+        except (OSError, ValueError, KeyError, EOFError, struct.error) as e:
+            print(f"Warning: Could not load price history {self.data_file}: {e}; starting empty")
+            self.series = {}
+
+    def _read(self) -> Dict[Tuple[str, str], PriceSeries]:
+        series_map = {}
+        with open(self.data_file, "rb") as f:
+            magic, version, header_len = HEADER.unpack(f.read(HEADER.size))
+            if magic != MAGIC or version not in DAY_TYPECODES:
+                raise ValueError("unsupported file format")
+            header = json.loads(f.read(header_len))
+            for entry in header["series"]:
+                series = PriceSeries()
+                count = entry["count"]
+                days = array(DAY_TYPECODES[version])
+                days.fromfile(f, count)
+                series.low.fromfile(f, count)
+                series.high.fromfile(f, count)
+                if header.get("byteorder") != sys.byteorder:
+                    days.byteswap()
+                    series.low.byteswap()
+                    series.high.byteswap()
+                series.days = array("q", days)
+                series_map[(entry["competitor"], entry["tier"])] = series
+        return series_map
+
+    def save(self) -> None:
+        """Persist the store; a no-op when nothing changed since the last load/save"""
+        if not self.dirty:
+            return
+
+        header = json.dumps({
+            "byteorder": sys.byteorder,
+            "series": [
+                {"competitor": competitor, "tier": tier, "count": len(series)}
+                for (competitor, tier), series in self.series.items()
+            ]
+        }).encode("utf-8")
+
+        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.data_file.with_suffix(".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, len(header)))
+            f.write(header)
+            for series in self.series.values():
+                series.days.tofile(f)
+                series.low.tofile(f)
+                series.high.tofile(f)
+        tmp_file.replace(self.data_file)
+        self.dirty = False
+
+    def record(self, competitor: str, tier: str, price_text: str, date=None) -> bool:
+        """Parse and store one price sample; returns False if the text has no price"""
+        parsed = parse_price_range(price_text)
+        if parsed is None:
+            return False
+        day = to_day(date or datetime.date.today())
+        if self.series.setdefault((competitor, tier), PriceSeries()).add(day, *parsed):
+            self.dirty = True
+        return True
+
+    def fingerprint(self) -> list:
+        """Cheap content fingerprint: length and CRC of every series' columns"""
+        return sorted(
+            [competitor, tier, len(series),
+             zlib.crc32(series.high, zlib.crc32(series.low, zlib.crc32(series.days)))]
+            for (competitor, tier), series in self.series.items()
+        )
+
+    def _series(self, competitor: str, tier: str) -> Optional[PriceSeries]:
+        series = self.series.get((competitor, tier))
+        return series if series is not None and len(series) else None
+
+    def query(self, competitor: str, tier: str, start=None, end=None) -> list:
+        """Return [(date, low, high)] samples within [start, end]"""
+        series = self._series(competitor, tier)
+        if series is None:
+            return []
+        lo, hi = series.bounds(None if start is None else to_day(start),
+                               None if end is None else to_day(end))
+        return [
+            (datetime.date.fromordinal(series.days[i]), series.low[i], series.high[i])
+            for i in range(lo, hi)
+        ]
+
+    def min_max(self, competitor: str, tier: str, start=None, end=None) -> Optional[dict]:
+        """Lowest low and highest high price over [start, end]"""
+        series = self._series(competitor, tier)
+        if series is None:
+            return None
+        lo, hi = series.bounds(None if start is None else to_day(start),
+                               None if end is None else to_day(end))
+        if lo >= hi:
+            return None
+        return {"min": min(series.low[lo:hi]), "max": max(series.high[lo:hi]), "samples": hi - lo}
+
+    def change_since(self, competitor: str, tier: str, since) -> Optional[dict]:
+        """Change of the mid price between the sample in effect at ``since`` and the latest one
+
+        The baseline is the last sample on or before ``since``, falling back
+        to the first sample when the history starts later.
+        """
+        series = self._series(competitor, tier)
+        if series is None:
+            return None
+        i = max(bisect_right(series.days, to_day(since)) - 1, 0)
+        before = (series.low[i] + series.high[i]) / 2
+        after = (series.low[-1] + series.high[-1]) / 2
+        return {
+            "from_date": datetime.date.fromordinal(series.days[i]).isoformat(),
+            "to_date": datetime.date.fromordinal(series.days[-1]).isoformat(),
+            "from_mid": before,
+            "to_mid": after,
+            "delta": round(after - before, 2),
+            "delta_pct": round((after - before) / before * 100, 2) if before else None,
+        }
+
+    def trend(self, competitor: str, tier: str, start=None, end=None) -> Optional[float]:
+        """Least-squares slope of the mid price over [start, end], in € per 30 days"""
+        series = self._series(competitor, tier)
+        if series is None:
+            return None
+        lo, hi = series.bounds(None if start is None else to_day(start),
+                               None if end is None else to_day(end))
+        n = hi - lo
+        if n < 2:
+            return None
+
+        days = series.days[lo:hi]
+        mids = [(a + b) / 2 for a, b in zip(series.low[lo:hi], series.high[lo:hi])]
+        mean_x = sum(days) / n
+        mean_y = sum(mids) / n
+        sxx = sum((x - mean_x) ** 2 for x in days)
+        if not sxx:
+            return None
+        sxy = sum((x - mean_x) * (y - mean_y) for x, y in zip(days, mids))
+        return round(sxy / sxx * 30, 2)
+
+    def latest(self, competitor: str, tier: str) -> Optional[Tuple[datetime.date, float, float]]:
+        series = self._series(competitor, tier)
+        if series is None:
+            return None
+        return datetime.date.fromordinal(series.days[-1]), series.low[-1], series.high[-1]
+
+    def summarize(self, today=None) -> dict:
+        """Per-series deltas used by the monthly competitor report"""
+        today = to_day(today or datetime.date.today())
+        summary = {}
+        for competitor, tier in self.series:
+            latest = self.latest(competitor, tier)
+            if latest is None:
+                continue
+            date, low, high = latest
+            summary[f"{competitor}/{tier}"] = {
+                "latest": {"date": date.isoformat(), "low": low, "high": high},
+                "change_30d": self.change_since(competitor, tier, today - 30),
+                "change_365d": self.change_since(competitor, tier, today - 365),
+                "range_365d": self.min_max(competitor, tier, today - 365, today),
+                "trend_per_30d": self.trend(competitor, tier, today - 90, today),
+            }
+        return summary
+
+
+if __name__ == "__main__":
+    history = PriceHistory()
+    print(json.dumps(history.summarize(), indent=2, ensure_ascii=False))
@@ -4,27 +4,50 @@ AI Productivity Tracker - Self Development Project
 Tracks work sessions, productivity metrics, and generates insights
 """
 
-import json
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 
+from storage import open_storage
+from tracing import traced
+
+SESSIONS = "tracker.sessions"
+TASKS = "tracker.tasks"
+GOALS = "tracker.goals"
+
 class ProductivityTracker:
+    # Storage collections/documents this tool reads (the daemon reloads it when they change)
+    STORAGE_KEYS = (SESSIONS, TASKS, GOALS)
+    
     def __init__(self):
+        # Legacy JSON file, imported into the shared storage on first use
         self.data_file = Path.home() / ".openclaw" / "productivity.json"
-        self.data = self.load_data()
+        self._storage = None
     
-    def load_data(self):
-        if self.data_file.exists():
-            with open(self.data_file, 'r') as f:
-                return json.load(f)
-        return {"sessions": [], "tasks": [], "goals": {}}
+    @property
+    def storage(self):
+        if self._storage is None:
+            self._storage = open_storage()
+            self._storage.migrate_json(self.data_file, {
+                "sessions": (SESSIONS, "start"),
+                "tasks": (TASKS, None)
+            }, {"goals": GOALS})
+        return self._storage
     
-    def save_data(self):
-        self.data_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.data_file, 'w') as f:
-            json.dump(self.data, f, indent=2)
+    @storage.setter
+    def storage(self, value):
+        self._storage = value
     
+    @traced("tracker.load_data", "tracker")
+    def load_data(self):
+        """Full dataset in the original productivity.json shape"""
+        return {
+            "sessions": self.storage.records(SESSIONS),
+            "tasks": self.storage.records(TASKS),
+            "goals": self.storage.get(GOALS, {})
+        }
+    
+    @traced("tracker.start_session", "tracker")
     def start_session(self, project, task_type):
         session = {
             "start": datetime.now().isoformat(),
@@ -32,15 +55,16 @@ class ProductivityTracker:
             "type": task_type,
             "status": "active"
         }
-        self.data["sessions"].append(session)
-        self.save_data()
+        self.storage.append(SESSIONS, session, session["start"])
         return f"✅ Started tracking: {project} - {task_type}"
     
+    @traced("tracker.end_session", "tracker")
     def end_session(self, notes=""):
-        if not self.data["sessions"] or self.data["sessions"][-1]["status"] != "active":
+        last = self.storage.last(SESSIONS)
+        if not last or last[1]["status"] != "active":
             return "❌ No active session to end"
         
-        session = self.data["sessions"][-1]
+        session_id, session = last
         session["end"] = datetime.now().isoformat()
         session["status"] = "completed"
         session["notes"] = notes
@@ -51,13 +75,15 @@ class ProductivityTracker:
         duration = (end - start).total_seconds() / 3600  # hours
         session["duration_hours"] = round(duration, 2)
         
-        self.save_data()
+        self.storage.update(SESSIONS, session_id, session)
         return f"✅ Session ended. Duration: {duration:.2f} hours"
     
+    @traced("tracker.get_stats", "tracker")
     def get_stats(self, days=7):
         cutoff = datetime.now() - timedelta(days=days)
+        # The (collection, ts) index narrows the scan; the exact comparison stays in Python
         recent_sessions = [
-            s for s in self.data["sessions"]
+            s for s in self.storage.records(SESSIONS, since=cutoff.date().isoformat())
             if datetime.fromisoformat(s["start"]) > cutoff
             and s.get("status") == "completed"
         ]
@@ -75,6 +101,7 @@ class ProductivityTracker:
             "projects": {k: round(v, 2) for k, v in projects.items()}
         }
     
+    @traced("tracker.report", "tracker")
     def report(self):
         stats = self.get_stats()
         report = f"""
@@ -92,8 +119,11 @@ Projects Breakdown:
         return report
 
 if __name__ == "__main__":
-    tracker = ProductivityTracker()
     import sys
+    from tracing import init_from_argv
+    
+    init_from_argv(sys.argv)
+    tracker = ProductivityTracker()
     
     if len(sys.argv) < 2:
         print(tracker.report())
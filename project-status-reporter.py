@@ -7,13 +7,61 @@ For: Santiago / StoryVerse Hub / Livre Magique
 
 import os
 import json
+import time
 import subprocess
 from datetime import datetime
 from pathlib import Path
 
+from file_manifest import SKIP_SUFFIXES, iter_files
+from http_policy import default_policy
+from tracing import span
+
 class ProjectStatusReporter:
+    GITHUB_REPOS = [
+        ("storyverse-landing", "StoryVerse Hub Landing Page"),
+        ("storyverse-components", "UI Components Library"),
+        ("trend-habit-tracker", "AI Trend Hunt Tool"),
+        ("moltbook-enhancements", "Publishing Platform Features"),
+        ("furniture-showroom", "Furniture Showroom Website"),
+        ("senin-hekayen-az", "Azerbaijan Storybook Site"),
+        ("senin-livre-clone", "Livre Magique Clone"),
+        ("openclaw-tools", "Development Tools")
+    ]
+    
+    LOCAL_PROJECTS = {
+        "brands/livre-magique/france": "Livre Magique France Market Entry",
+        "brands/storyverse-hub": "StoryVerse Hub Platform",
+        "projects/trend-habit-tracker": "Trend Habit Tracker",
+        "tools": "Automation Tools",
+        "business": "Business Strategy Documents"
+    }
+    
     def __init__(self):
         self.workspace = "/home/node/.openclaw/workspace"
+        self.github_api = "https://api.github.com"
+        self.pages_base = "https://kaithebot.github.io"
+        # Watch mode only: per-project {relative path: size} and cached remote probes
+        self._file_index = None
+        self._repo_status = None
+        self._http_policy = None
+        self.reset()
+    
+    @property
+    def http_policy(self):
+        if self._http_policy is None:
+            self._http_policy = default_policy()
+        return self._http_policy
+    
+    @http_policy.setter
+    def http_policy(self, value):
+        self._http_policy = value
+    
+    @property
+    def report_file(self):
+        return os.path.join(self.workspace, "daily", "project-status-report.md")
+    
+    def reset(self):
+        """Clear report state so a long-lived reporter can run repeatedly"""
         self.report = []
         self.summary = {
             "github_repos": [],
@@ -25,12 +73,19 @@ class ProjectStatusReporter:
     
     def run(self):
         """Generate comprehensive status report"""
-        self.print_header()
-        self.check_github_repos()
-        self.check_local_projects()
-        self.check_pending_pushes()
-        self.generate_summary()
-        self.print_footer()
+        self.reset()
+        with span("status.run", "status"):
+            with span("status.header", "status"):
+                self.print_header()
+            with span("status.github_repos", "status"):
+                self.check_github_repos()
+            with span("status.local_projects", "status"):
+                self.check_local_projects()
+            with span("status.pending_pushes", "status"):
+                self.check_pending_pushes()
+            with span("status.summary", "status"):
+                self.generate_summary()
+                self.print_footer()
         
         return "\n".join(self.report)
     
@@ -47,19 +102,11 @@ class ProjectStatusReporter:
         self.report.append("🌐 GITHUB REPOSITORIES")
         self.report.append("-" * 80)
         
-        repos = [
-            ("storyverse-landing", "StoryVerse Hub Landing Page"),
-            ("storyverse-components", "UI Components Library"),
-            ("trend-habit-tracker", "AI Trend Hunt Tool"),
-            ("moltbook-enhancements", "Publishing Platform Features"),
-            ("furniture-showroom", "Furniture Showroom Website"),
-            ("senin-hekayen-az", "Azerbaijan Storybook Site"),
-            ("senin-livre-clone", "Livre Magique Clone"),
-            ("openclaw-tools", "Development Tools")
-        ]
-        
-        for repo_name, description in repos:
-            status = self.check_repo_status(repo_name)
+        for repo_name, description in self.GITHUB_REPOS:
+            status = self._repo_status.get(repo_name) if self._repo_status else None
+            if status is None:
+                with span("status.repo_probe", "network", repo=repo_name):
+                    status = self.check_repo_status(repo_name)
             self.summary["github_repos"].append({
                 "name": repo_name,
                 "description": description,
@@ -81,23 +128,12 @@ class ProjectStatusReporter:
         """Check if a GitHub repo exists and has Pages enabled"""
         try:
             # Check if repo exists using curl
-            result = subprocess.run(
-                ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-                 f"https://api.github.com/repos/kaithebot/{repo_name}"],
-                capture_output=True, text=True, timeout=10
-            )
-            
-            exists = result.stdout.strip() == "200"
+            exists = self.probe(f"{self.github_api}/repos/kaithebot/{repo_name}") == "200"
             
             # Check if GitHub Pages is enabled
             pages_enabled = False
             if exists:
-                pages_result = subprocess.run(
-                    ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}",
-                     f"https://kaithebot.github.io/{repo_name}/"],
-                    capture_output=True, text=True, timeout=10
-                )
-                pages_enabled = pages_result.stdout.strip() == "200"
+                pages_enabled = self.probe(f"{self.pages_base}/{repo_name}/") == "200"
             
             return {
                 "exists": exists,
@@ -106,23 +142,40 @@ class ProjectStatusReporter:
         except:
             return {"exists": False, "pages_enabled": False}
     
+    def probe(self, url, default_timeout=10):
+        """HTTP status code of a GET (curl), "000" when unreachable
+        
+        The timeout adapts to the host's observed latency, and a slow probe is
+        hedged with a second one (GETs are idempotent) - see http_policy.py.
+        """
+        def attempt(timeout):
+            result = subprocess.run(
+                ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", "--max-time", f"{timeout:.3f}", url],
+                capture_output=True, text=True, timeout=timeout + 1
+            )
+            if result.returncode == 28:
+                raise TimeoutError(url)
+            if result.returncode != 0:
+                raise ConnectionError(f"curl exited with {result.returncode}")
+            return result.stdout.strip()
+        
+        policy = self.http_policy
+        try:
+            return policy.request(url, attempt, policy.timeout_for(url, default_timeout), hedge=True,
+                                  timeout_errors=(TimeoutError, subprocess.TimeoutExpired))
+        except (OSError, subprocess.TimeoutExpired):
+            return "000"
+    
     def check_local_projects(self):
         """Check local projects in workspace"""
         self.report.append("💻 LOCAL PROJECTS")
         self.report.append("-" * 80)
         
-        projects = {
-            "brands/livre-magique/france": "Livre Magique France Market Entry",
-            "brands/storyverse-hub": "StoryVerse Hub Platform",
-            "projects/trend-habit-tracker": "Trend Habit Tracker",
-            "tools": "Automation Tools",
-            "business": "Business Strategy Documents"
-        }
-        
-        for path, description in projects.items():
+        for path, description in self.LOCAL_PROJECTS.items():
             full_path = os.path.join(self.workspace, path)
             if os.path.exists(full_path):
-                file_count, total_size = self.count_files(full_path)
+                with span("status.count_files", "io", path=path):
+                    file_count, total_size = self.project_counts(path, full_path)
                 self.summary["local_projects"].append({
                     "path": path,
                     "description": description,
@@ -140,39 +193,172 @@ class ProjectStatusReporter:
         count = 0
         total_size = 0
         
-        for root, dirs, files in os.walk(path):
-            # Skip .git and node_modules
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '.next']]
-            
-            for file in files:
-                if not file.endswith(('.db', '.log', '.tmp')):
-                    count += 1
-                    try:
-                        total_size += os.path.getsize(os.path.join(root, file)) / 1024
-                    except:
-                        pass
+        # Skips .git, node_modules, .next and *.db/*.log/*.tmp
+        for _, st in iter_files(path):
+            count += 1
+            total_size += st.st_size / 1024
         
         return count, total_size
     
+    def project_counts(self, path, full_path):
+        """File count and size for a local project, from the watch index when there is one"""
+        files = self._file_index.get(path) if self._file_index is not None else None
+        if files is None:
+            return self.count_files(full_path)
+        return len(files), sum(files.values()) / 1024
+    
+    def index_project(self, path):
+        """(Re)build the watch index entry for one local project"""
+        full_path = os.path.join(self.workspace, path)
+        if os.path.isdir(full_path):
+            self._file_index[path] = {rel_path: st.st_size for rel_path, st in iter_files(full_path)}
+        else:
+            self._file_index.pop(path, None)
+    
+    def update_project(self, path, changed):
+        """Apply changed relative paths (files or directories) to one project's index"""
+        files = self._file_index.get(path)
+        if changed is None or files is None:
+            self.index_project(path)
+            return
+        
+        full_path = os.path.join(self.workspace, path)
+        for rel_path in changed:
+            target = os.path.join(full_path, rel_path)
+            if files.pop(rel_path, None) is None:
+                # Not a known file: a directory that appeared, vanished or moved
+                prefix = rel_path + "/"
+                for stale in [p for p in files if p.startswith(prefix)]:
+                    del files[stale]
+            try:
+                if os.path.isdir(target) and not os.path.islink(target):
+                    files.update((f"{rel_path}/{sub}", st.st_size) for sub, st in iter_files(target))
+                elif os.path.isfile(target) and not rel_path.endswith(SKIP_SUFFIXES):
+                    files[rel_path] = os.stat(target).st_size
+            except OSError:
+                continue
+    
+    def refresh_remote(self):
+        """Re-probe every GitHub repo; later reports reuse these results"""
+        statuses = {}
+        for repo_name, _ in self.GITHUB_REPOS:
+            with span("status.repo_probe", "network", repo=repo_name):
+                statuses[repo_name] = self.check_repo_status(repo_name)
+        self._repo_status = statuses
+    
+    def write_report(self, report, report_file=None):
+        """Atomically replace the report file, only if anything but the timestamp changed"""
+        report_file = report_file or self.report_file
+        try:
+            with open(report_file, "r") as f:
+                previous = f.read()
+        except OSError:
+            previous = None
+        
+        def body(text):
+            return [line for line in text.split("\n") if not line.startswith("Generated: ")]
+        
+        if previous is not None and body(previous) == body(report):
+            return False
+        
+        os.makedirs(os.path.dirname(report_file), exist_ok=True)
+        tmp_file = report_file + ".tmp"
+        with open(tmp_file, "w") as f:
+            f.write(report)
+        os.replace(tmp_file, report_file)
+        return True
+    
+    def watch(self, report_file=None, remote_interval=300.0, settle=0.5, poll_interval=2.0,
+              polling=False, max_reports=None):
+        """Keep the report current from filesystem change events
+        
+        Local project counts are updated per changed path instead of re-walking
+        the trees; GitHub repos are re-probed every ``remote_interval`` seconds
+        (which is also when new or removed project directories are noticed).
+        The report is regenerated after each burst of changes and rewritten
+        only when its content changes.
+        """
+        from fs_watch import PollingWatcher, open_watcher
+        
+        roots = {os.path.join(self.workspace, path): path for path in self.LOCAL_PROJECTS}
+        self._file_index = {}
+        for path in self.LOCAL_PROJECTS:
+            self.index_project(path)
+        self.refresh_remote()
+        watcher = open_watcher([r for r, p in roots.items() if p in self._file_index], poll_interval, polling)
+        
+        mode = "polling" if isinstance(watcher, PollingWatcher) else "inotify"
+        print(f"👀 Watching {len(self._file_index)} projects ({mode}), remote every {remote_interval:g}s")
+        
+        reports = 0
+        next_remote = time.monotonic() + remote_interval
+        regenerate = True
+        try:
+            while True:
+                if regenerate:
+                    report = self.run()
+                    if self.write_report(report, report_file):
+                        print(f"📝 Report updated: {report_file or self.report_file}")
+                    reports += 1
+                    if max_reports is not None and reports >= max_reports:
+                        return
+                
+                changes = watcher.wait(max(0.0, next_remote - time.monotonic()))
+                while changes:  # let a burst of writes settle into one regeneration
+                    more = watcher.wait(settle)
+                    if not more:
+                        break
+                    for root, paths in more.items():
+                        if paths is None or changes.get(root, ()) is None:
+                            changes[root] = None
+                        else:
+                            changes.setdefault(root, set()).update(paths)
+                
+                for root, paths in changes.items():
+                    self.update_project(roots[root], paths)
+                regenerate = bool(changes)
+                
+                if time.monotonic() >= next_remote:
+                    self.refresh_remote()
+                    for root, path in roots.items():
+                        if (path in self._file_index) != os.path.isdir(root):
+                            self.index_project(path)
+                            if path in self._file_index:
+                                watcher.add(root)
+                    next_remote = time.monotonic() + remote_interval
+                    regenerate = True
+        except KeyboardInterrupt:
+            print("👋 Watch stopped")
+        finally:
+            watcher.close()
+            self._file_index = None
+            self._repo_status = None
+    
     def check_pending_pushes(self):
         """Check for repositories with pending pushes"""
         self.report.append("⏳ PENDING PUSHES (Blocked by GITHUB_TOKEN)")
         self.report.append("-" * 80)
         
-        pending = [
-            {
-                "name": "livre-magique-france",
-                "files": 20,
-                "description": "France Market Entry Package",
-                "status": "Committed locally, needs GITHUB_TOKEN to push"
-            }
-        ]
+        from workspace_scanner import WorkspaceScanner
+        
+        scanner = WorkspaceScanner(self.workspace)
+        pending = []
+        for repo in scanner.pending_pushes():
+            unpushed = repo["ahead"] if repo["has_upstream"] else repo["commits"]
+            as_of = " (as of last scan)" if repo.get("cached") else ""
+            pending.append({
+                "name": repo["name"],
+                "path": repo["path"],
+                "commits": unpushed,
+                "description": f"Branch {repo['branch']}" + ("" if repo["has_upstream"] else " (no upstream)"),
+                "status": f"Committed locally, not pushed{as_of}" + (" - working tree dirty" if repo["dirty"] else "")
+            })
         
         for item in pending:
             self.summary["pending_pushes"].append(item)
             self.report.append(f"⏳ {item['name']}")
             self.report.append(f"   📁 {item['description']}")
-            self.report.append(f"   📄 {item['files']} files ready")
+            self.report.append(f"   📄 {item['commits']} commits ready")
             self.report.append(f"   ⚠️  {item['status']}")
             self.report.append("")
     
@@ -213,7 +399,7 @@ class ProjectStatusReporter:
             self.report.append("-" * 80)
             self.report.append("• GITHUB_TOKEN environment variable needed for:")
             for pending in self.summary["pending_pushes"]:
-                self.report.append(f"  - {pending['name']} ({pending['files']} files)")
+                self.report.append(f"  - {pending['name']} ({pending['commits']} commits)")
             self.report.append("")
     
     def print_footer(self):
@@ -228,12 +414,26 @@ class ProjectStatusReporter:
         self.report.append("=" * 80)
 
 if __name__ == "__main__":
+    import sys
+    from tracing import init_from_argv
+    
+    def option(flag, default):
+        return float(sys.argv[sys.argv.index(flag) + 1]) if flag in sys.argv else default
+    
+    init_from_argv(sys.argv)
     reporter = ProjectStatusReporter()
+    
+    if "--watch" in sys.argv:
+        reporter.watch(
+            remote_interval=option("--remote-interval", 300.0),
+            poll_interval=option("--poll-interval", 2.0),
+            polling="--poll" in sys.argv
+        )
+        sys.exit(0)
+    
     report = reporter.run()
     
-    # Save to file
-    os.makedirs("/home/node/.openclaw/workspace/daily", exist_ok=True)
-    with open("/home/node/.openclaw/workspace/daily/project-status-report.md", "w") as f:
-        f.write(report)
+    # Save to file (left untouched when only the timestamp would change)
+    reporter.write_report(report)
     
     print(report)
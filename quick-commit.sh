@@ -1,10 +1,17 @@
 #!/bin/bash
 
 # Quick Commit Helper
-# Usage: ./quick-commit.sh "commit message"
+# Usage: ./quick-commit.sh "commit message" [repo-dir...]
+# With repo dirs, commits and pushes all of them concurrently (deploy_orchestrator.py)
 
 MESSAGE=${1:-"Update $(date +%H:%M)"}
 
+if [ $# -gt 1 ]; then
+    TOOLS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+    echo "📝 Quick commit in $(($# - 1)) repos with message: $MESSAGE"
+    exec python3 "$TOOLS_DIR/deploy_orchestrator.py" --skip-build -m "$MESSAGE" "${@:2}"
+fi
+
 echo "📝 Quick commit with message: $MESSAGE"
 
 git add .
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Scaffold Engine
+Project scaffolding from a local, versioned template cache
+**Created**: 2026-10-19
+
+Each template (nextjs, react, vanilla) is generated once, under a placeholder
+project name, into ``~/.openclaw/templates/<type>-<version>/``; the version
+is a hash of the recipe, so changing a generator command gets a fresh cache
+entry. Later scaffolds copy the cached tree instead of running npx:
+
+    every file      reflinked where the filesystem supports it, else copied,
+                    so editing a scaffolded file can't reach the cache
+    placeholders    files that mention the placeholder name (package.json,
+                    lock files, README, node_modules/.package-lock.json ...)
+                    are rewritten with the real name
+
+``--hardlink`` hardlinks node_modules/ instead, which is faster where reflinks
+aren't available but shares each file with the cache and every project made
+from it: a postinstall script or patch-package run in one project edits them
+all. Only use it for projects whose dependencies are never modified in place.
+
+Cached scaffolds work offline. Several projects are scaffolded concurrently;
+projects sharing a template wait for a single build of it.
+
+Usage:
+    python3 scaffold_engine.py <project-name> [nextjs|react|vanilla]
+    python3 scaffold_engine.py site-a:nextjs site-b:vanilla site-c --type react --jobs 4
+    python3 scaffold_engine.py --warm nextjs react      # build templates ahead of time
+    python3 scaffold_engine.py --refresh <project-name> nextjs
+    python3 scaffold_engine.py --hardlink site-a site-b  # share node_modules with the cache
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+WORKSPACE = "/home/node/.openclaw/workspace"
+PLACEHOLDER = "openclaw-template-project"
+TEMPLATE_FORMAT = 2
+HARDLINK_DIRS = frozenset({"node_modules"})
+# Files inside HARDLINK_DIRS that npm writes the project name into
+SHARED_PLACEHOLDER_FILES = frozenset({"node_modules/.package-lock.json"})
+# Generator leftovers that must not be shared between projects
+TEMPLATE_SKIP = frozenset({".git"})
+MAX_PLACEHOLDER_SCAN = 1 << 20
+FICLONE = 0x40049409  # <linux/fs.h>
+
+VANILLA_INDEX = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Project</title>
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: system-ui, sans-serif; padding: 2rem; }
+    </style>
+</head>
+<body>
+    <h1>Hello World</h1>
+    <p>Project initialized successfully!</p>
+</body>
+</html>
+"""
+
+# "{dir}" is replaced with the directory to generate into
+TEMPLATES = {
+    "nextjs": {
+        "command": ["npx", "create-next-app@latest", "{dir}", "--typescript", "--tailwind", "--eslint", "--app",
+                    "--src-dir", "--import-alias", "@/*", "--no-turbopack", "--yes"]
+    },
+    "react": {
+        "command": ["npx", "create-react-app", "{dir}", "--template", "typescript"]
+    },
+    "vanilla": {
+        "files": {"index.html": VANILLA_INDEX}
+    }
+}
+
+
+class ScaffoldError(Exception):
+    """A template could not be built or a project could not be created"""
+
+
+def target_dir(project_name: str, workspace: str = WORKSPACE) -> Path:
+    """Where project-init.sh has always put a project of this name"""
+    if project_name.startswith(("storyverse", "livre")):
+        return Path(workspace) / "brands" / project_name
+    return Path(workspace) / "projects" / project_name
+
+
+def template_version(recipe: dict) -> str:
+    digest = hashlib.sha1(json.dumps([TEMPLATE_FORMAT, recipe], sort_keys=True).encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+class ScaffoldEngine:
+    """Build templates once, then create projects from the cached copies"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, templates: Optional[Dict[str, dict]] = None,
+                 hardlink: bool = False):
+        self.cache_dir = Path(cache_dir) if cache_dir else Path.home() / ".openclaw" / "templates"
+        self.templates = templates or TEMPLATES
+        self._locks: Dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._reflink = sys.platform.startswith("linux")
+        self.hardlink = hardlink  # opt-in: projects share node_modules files with the cache
+
+    def _lock(self, template: str) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(template, threading.Lock())
+
+    def template_dir(self, template: str) -> Path:
+        return self.cache_dir / f"{template}-{template_version(self.templates[template])}"
+
+    def load_template(self, template: str) -> Optional[dict]:
+        """Metadata of the cached template, or None when it isn't built yet"""
+        try:
+            with open(self.template_dir(template) / "template.json", "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def ensure_template(self, template: str, refresh: bool = False) -> dict:
+        """Cached template metadata, building the template first if needed"""
+        if template not in self.templates:
+            raise ScaffoldError(f"Unknown project type: {template}")
+        with self._lock(template):
+            meta = None if refresh else self.load_template(template)
+            return meta or self.build_template(template)
+
+    def build_template(self, template: str) -> dict:
+        """Generate a template into a staging dir and move it into the cache atomically"""
+        recipe = self.templates[template]
+        final = self.template_dir(template)
+        staging = self.cache_dir / f".build-{template}-{os.getpid()}-{threading.get_ident()}"
+        tree = staging / "tree" / PLACEHOLDER
+        shutil.rmtree(staging, ignore_errors=True)
+        tree.parent.mkdir(parents=True)
+        print(f"🧱 Building {template} template (one-time, cached in {self.cache_dir})...")
+
+        start = time.perf_counter()
+        try:
+            if "command" in recipe:
+                command = [arg.replace("{dir}", str(tree)) for arg in recipe["command"]]
+                result = subprocess.run(command, cwd=tree.parent, stdout=subprocess.PIPE,
+                                        stderr=subprocess.STDOUT, text=True)
+                if result.returncode != 0:
+                    tail = "\n".join(result.stdout.strip().splitlines()[-5:])
+                    raise ScaffoldError(f"{' '.join(command[:2])} exited with {result.returncode}\n{tail}")
+            else:
+                tree.mkdir()
+            for rel_path, content in recipe.get("files", {}).items():
+                (tree / rel_path).parent.mkdir(parents=True, exist_ok=True)
+                (tree / rel_path).write_text(content)
+            for name in TEMPLATE_SKIP:
+                shutil.rmtree(tree / name, ignore_errors=True)
+
+            files, placeholders = self._scan_tree(tree)
+            meta = {
+                "template": template,
+                "version": template_version(recipe),
+                "recipe": recipe,
+                "built_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "build_seconds": round(time.perf_counter() - start, 3),
+                "files": files,
+                "placeholders": placeholders
+            }
+            with open(staging / "template.json", "w") as f:
+                json.dump(meta, f, indent=2)
+
+            if final.exists():
+                retired = final.with_name(f".old-{final.name}-{os.getpid()}")
+                final.rename(retired)
+                staging.rename(final)
+                shutil.rmtree(retired, ignore_errors=True)
+            else:
+                staging.rename(final)
+        except OSError as e:
+            raise ScaffoldError(f"{template} template build failed: {e}") from e
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+        self._prune_versions(template, final)
+        print(f"✅ {template} template cached ({meta['files']} files, {meta['build_seconds']:.1f}s)")
+        return meta
+
+    def _prune_versions(self, template: str, keep: Path) -> None:
+        for old in self.cache_dir.glob(f"{template}-*"):
+            if old != keep and old.is_dir():
+                shutil.rmtree(old, ignore_errors=True)
+
+    @staticmethod
+    def _scan_tree(tree: Path) -> Tuple[int, List[str]]:
+        """(file count, files that mention the placeholder; node_modules only for SHARED_PLACEHOLDER_FILES)"""
+        needle = PLACEHOLDER.encode("utf-8")
+        files = 0
+        placeholders = []
+        for dirpath, dirnames, filenames in os.walk(tree):
+            rel_dir = os.path.relpath(dirpath, tree)
+            shared = bool(HARDLINK_DIRS & set(Path(rel_dir).parts))
+            files += len(filenames)
+            for name in filenames:
+                if shared and Path(rel_dir, name).as_posix() not in SHARED_PLACEHOLDER_FILES:
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    if os.path.islink(path) or os.path.getsize(path) > MAX_PLACEHOLDER_SCAN:
+                        continue
+                    with open(path, "rb") as f:
+                        if needle in f.read():
+                            placeholders.append(Path(rel_dir, name).as_posix())
+                except OSError:
+                    continue
+        return files, sorted(placeholders)
+
+    def _clone_file(self, src: str, dst: str) -> str:
+        """Reflink src to dst where supported, otherwise copy; returns the method used"""
+        if self._reflink:
+            import fcntl
+
+            try:
+                with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+                shutil.copymode(src, dst)
+                return "reflink"
+            except OSError:
+                self._reflink = False  # the cache's filesystem can't; don't keep trying
+        shutil.copy2(src, dst)
+        return "copy"
+
+    def _link_file(self, src: str, dst: str) -> str:
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError:  # different filesystem or links not allowed
+            return self._clone_file(src, dst)
+
+    def materialize(self, template: str, meta: dict, destination: Path, project_name: str) -> Dict[str, int]:
+        """Copy the cached tree into the (existing, empty) ``destination`` and substitute the project name"""
+        tree = self.template_dir(template) / "tree" / PLACEHOLDER
+        placeholders = set(meta.get("placeholders", ()))
+        methods: Dict[str, int] = {}
+        # One scandir pass per directory: d_type answers is_dir/is_symlink without extra stats
+        stack = [(str(tree), str(destination), "", False)]
+        while stack:
+            src_dir, dst_dir, rel_dir, shared = stack.pop()
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    dst = f"{dst_dir}/{entry.name}"
+                    rel_path = f"{rel_dir}{entry.name}"
+                    if entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), dst)
+                        method = "symlink"
+                    elif entry.is_dir():
+                        os.mkdir(dst)
+                        stack.append((entry.path, dst, rel_path + "/", shared or entry.name in HARDLINK_DIRS))
+                        continue
+                    elif rel_path in placeholders:
+                        with open(entry.path, "r", encoding="utf-8", errors="surrogateescape") as f:
+                            content = f.read().replace(PLACEHOLDER, project_name)
+                        with open(dst, "w", encoding="utf-8", errors="surrogateescape") as f:
+                            f.write(content)
+                        shutil.copymode(entry.path, dst)
+                        method = "substituted"
+                    elif shared and self.hardlink:
+                        method = self._link_file(entry.path, dst)
+                    else:
+                        method = self._clone_file(entry.path, dst)
+                    methods[method] = methods.get(method, 0) + 1
+        return methods
+
+    def init_project(self, project_name: str, template: str = "nextjs", destination: Optional[Path] = None,
+                     refresh: bool = False) -> dict:
+        """Create one project; returns a result dict and never raises for per-project failures"""
+        start = time.perf_counter()
+        destination = Path(destination) if destination else target_dir(project_name)
+        result = {"project": project_name, "template": template, "path": str(destination), "ok": False}
+        try:
+            if destination.exists():
+                raise ScaffoldError(f"Directory already exists: {destination}")
+            meta = self.ensure_template(template, refresh)
+            try:
+                destination.parent.mkdir(parents=True, exist_ok=True)
+                destination.mkdir()  # claims the directory, even against a concurrent scaffold
+            except FileExistsError:
+                raise ScaffoldError(f"Directory already exists: {destination}")
+            except OSError as e:
+                raise ScaffoldError(f"cannot create {destination}: {e}") from e
+            try:
+                result["methods"] = self.materialize(template, meta, destination, project_name)
+            except OSError as e:
+                shutil.rmtree(destination, ignore_errors=True)
+                raise ScaffoldError(f"copy failed: {e}") from e
+            result["ok"] = True
+        except ScaffoldError as e:
+            result["error"] = str(e)
+        result["seconds"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def init_many(self, projects: List[tuple], jobs: Optional[int] = None, refresh: bool = False) -> List[dict]:
+        """Scaffold several (name, template[, destination]) projects concurrently"""
+        if refresh:  # rebuild each template once, not once per project
+            for template in sorted({p[1] for p in projects if p[1] in self.templates}):
+                try:
+                    self.ensure_template(template, refresh=True)
+                except ScaffoldError as e:
+                    print(f"❌ {e}")
+        jobs = jobs or min(len(projects), os.cpu_count() or 1) or 1
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="scaffold") as pool:
+            return list(pool.map(lambda p: self.init_project(*p), projects))
+
+
+def print_result(result: dict) -> None:
+    if result["ok"]:
+        methods = ", ".join(f"{count} {method}" for method, count in sorted(result["methods"].items()))
+        print(f"✅ {result['project']} ({result['template']}) → {result['path']} "
+              f"in {result['seconds']:.2f}s [{methods}]")
+    else:
+        print(f"❌ {result['project']} ({result['template']}): {result['error']}")
+
+
+def main(argv: List[str]) -> int:
+    default_type, jobs, refresh, warm, hardlink, names = "nextjs", None, False, False, False, []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        if arg == "--type":
+            i += 1
+            default_type = argv[i]
+        elif arg in ("-j", "--jobs"):
+            i += 1
+            jobs = int(argv[i])
+        elif arg == "--refresh":
+            refresh = True
+        elif arg == "--warm":
+            warm = True
+        elif arg == "--hardlink":
+            hardlink = True
+        else:
+            names.append(arg)
+        i += 1
+
+    engine = ScaffoldEngine(hardlink=hardlink)
+    if warm:
+        ok = True
+        for template in names or list(engine.templates):
+            try:
+                engine.ensure_template(template, refresh)
+            except ScaffoldError as e:
+                print(f"❌ {e}")
+                ok = False
+        return 0 if ok else 1
+
+    if not names:
+        print("Usage: scaffold_engine.py <project-name>[:type] ... [--type nextjs|react|vanilla] [--jobs N] [--hardlink]")
+        return 1
+    if len(names) == 2 and names[1] in engine.templates:  # project-init.sh form: <name> <type>
+        names = [f"{names[0]}:{names[1]}"]
+    projects = [tuple(n.split(":", 1)) if ":" in n else (n, default_type) for n in names]
+
+    for name, template in projects:
+        print(f"🚀 Creating new {template} project: {name}")
+    results = engine.init_many(projects, jobs, refresh)
+    for result in results:
+        print_result(result)
+
+    if len(results) == 1 and results[0]["ok"]:
+        print("📝 Next steps:")
+        print(f"   cd {results[0]['path']}")
+        print("   git init")
+        print("   git add .")
+        print("   git commit -m 'Initial commit'")
+    return 0 if all(r["ok"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
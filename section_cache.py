@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Report Section Cache
+Memoizes report section builders keyed by the fingerprint of their inputs
+**Created**: 2026-10-19
+
+A section is rebuilt only when its fingerprint changes. The fingerprint
+covers the declared inputs plus the bytecode of the builder and of the
+same-module helpers it calls, so editing either invalidates the cached
+output. Code imported from other modules is not tracked.
+"""
+
+import datetime
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from tracing import span
+
+
+def _hash_code(code, digest) -> None:
+    """Feed a code object into ``digest`` without anything process-specific
+
+    Nested code objects (lambdas, comprehensions, generator expressions)
+    are hashed recursively instead of through their repr, which embeds a
+    memory address.
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            digest.update(b"<code>")
+            _hash_code(const, digest)
+        else:
+            digest.update(repr(const).encode("utf-8"))
+            digest.update(b"\0")
+
+
+def _helpers(function: Callable, owner: Any, code) -> list:
+    """Functions a builder can reach by name: methods on its instance and module globals"""
+    found = []
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if hasattr(const, "co_code"):
+            names.update(const.co_names)
+    for name in sorted(names):
+        target = getattr(type(owner), name, None) if owner is not None else None
+        if target is None:
+            target = getattr(function, "__globals__", {}).get(name)
+        target = getattr(target, "__func__", target)
+        if getattr(target, "__code__", None) is not None and getattr(target, "__module__", None) == function.__module__:
+            found.append(target)
+    return found
+
+
+# (function, owner class) -> code fingerprint; code doesn't change within a process
+_code_fingerprints: Dict[tuple, str] = {}
+
+
+def _code_fingerprint(builder: Callable) -> str:
+    """Hash of a builder's code plus every same-module helper it calls, transitively
+
+    Helpers are found by name (``self._helper(...)`` on the builder's
+    instance, or module-level functions); anything imported from another
+    module is not tracked - pass a version in the section inputs for those.
+    Computed once per function and owner class per process.
+    """
+    owner = getattr(builder, "__self__", None)
+    key = (getattr(builder, "__func__", builder), type(owner))
+    cached = _code_fingerprints.get(key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    pending = [getattr(builder, "__func__", builder)]
+    seen = set()
+    while pending:
+        function = pending.pop()
+        if function in seen:
+            continue
+        seen.add(function)
+        digest.update(function.__qualname__.encode("utf-8"))
+        _hash_code(function.__code__, digest)
+        pending.extend(_helpers(function, owner, function.__code__))
+    _code_fingerprints[key] = digest.hexdigest()
+    return _code_fingerprints[key]
+
+
+def fingerprint(builder: Callable, inputs: Any = None) -> str:
+    """Stable fingerprint of a section builder and its inputs"""
+    payload = json.dumps(inputs, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(f"{_code_fingerprint(builder)}:{payload}".encode("utf-8")).hexdigest()
+
+
+class SectionCache:
+    """Persistent per-section memoization with build time tracking"""
+
+    def __init__(self, cache_file: Optional[Path] = None):
+        self.cache_file = Path(cache_file) if cache_file else Path.home() / ".openclaw" / "report_sections.json"
+        self.sections: Dict[str, dict] = self._load()
+        self.build_times: Dict[str, float] = {}  # this run: build time, or lookup time when cached
+        self.rebuilt: list = []
+        self.dirty = False
+
+    def _load(self) -> dict:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def get(self, name: str, builder: Callable, inputs: Any = None) -> Any:
+        """Return the cached section output, rebuilding it when its fingerprint changed"""
+        with span(f"section.{name}", "report") as sp:
+            start = time.perf_counter()
+            key = fingerprint(builder, inputs)
+            entry = self.sections.get(name)
+            if entry and entry.get("fingerprint") == key:
+                sp.set(cached=True)
+                self.build_times[name] = time.perf_counter() - start
+                return entry["value"]
+
+            sp.set(cached=False)
+            start = time.perf_counter()
+            value = builder()
+            elapsed = time.perf_counter() - start
+
+            # Round-trip through JSON so fresh and cached values look identical to callers
+            value = json.loads(json.dumps(value, default=str, ensure_ascii=False))
+            self.sections[name] = {
+                "fingerprint": key,
+                "value": value,
+                "build_seconds": round(elapsed, 6),
+                "built_at": datetime.datetime.now().isoformat()
+            }
+            self.build_times[name] = elapsed
+            self.rebuilt.append(name)
+            self.dirty = True
+            return value
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        """Drop one section (or all of them) so the next access rebuilds it"""
+        if name is None:
+            self.sections.clear()
+        else:
+            self.sections.pop(name, None)
+        self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(self.sections, f, ensure_ascii=False)
+            tmp_file.replace(self.cache_file)
+            self.dirty = False
+        except OSError as e:
+            print(f"Warning: Could not save section cache: {e}")
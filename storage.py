@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Storage
+Pluggable persistence shared by the tools: record collections plus keyed documents
+**Created**: 2026-10-19
+
+The default engine is SQLite in WAL mode (~/.openclaw/openclaw.db). Records
+are indexed by (collection, timestamp), writes inside ``batch()`` share one
+transaction, and every statement is a fixed parameterized query so sqlite3's
+statement cache keeps it prepared. The JSON engine keeps the original
+whole-file rewrite model, for comparison and as a fallback.
+
+    OPENCLAW_STORAGE=sqlite|json    engine (default: sqlite)
+    OPENCLAW_DB=/path/to/file       storage file (default: ~/.openclaw/openclaw.db or openclaw.json)
+
+Each tool's legacy JSON file is imported once through ``migrate_json()``.
+Large keyed data (e.g. competitor tracking data) goes through ``DocumentMap``,
+which stores one document per entry and reads entries on first access.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, MutableMapping
+from pathlib import Path
+
+
+def read_json(path) -> object:
+    """Parse a JSON file with one unbuffered read (json needs the whole document anyway)"""
+    with open(path, "rb", buffering=0) as f:
+        return json.loads(f.read())
+
+
+def _dumps(value: object) -> str:
+    return json.dumps(value, default=str, ensure_ascii=False)
+
+
+class Storage(ABC):
+    """Interface shared by the storage engines"""
+
+    path: Path
+
+    @abstractmethod
+    def append(self, collection: str, record: dict, ts: str | None = None) -> int:
+        """Store a record and return its id"""
+
+    @abstractmethod
+    def append_many(self, collection: str, records: Iterable[dict], ts_field: str | None = None) -> int:
+        """Store records in one transaction, timestamped from ``ts_field``; returns the count"""
+
+    @abstractmethod
+    def update(self, collection: str, record_id: int, record: dict, ts: str | None = None) -> None:
+        ...
+
+    @abstractmethod
+    def records(self, collection: str, since: str | None = None) -> list[dict]:
+        """Records in insertion order, optionally only those with ``ts >= since``"""
+
+    def iter_records(self, collection: str) -> Iterable[dict]:
+        """Stream every record in insertion order without building the full list"""
+        return iter(self.records(collection))
+
+    @abstractmethod
+    def last(self, collection: str) -> tuple[int, dict] | None:
+        """(id, record) of the most recently appended record"""
+
+    @abstractmethod
+    def count(self, collection: str) -> int:
+        ...
+
+    @abstractmethod
+    def get(self, key: str, default: object = None) -> object:
+        """Read a keyed document"""
+
+    @abstractmethod
+    def put(self, key: str, value: object) -> None:
+        """Create or replace a keyed document"""
+
+    @abstractmethod
+    def batch(self):
+        """Context manager grouping writes into one transaction (nestable)"""
+
+    @abstractmethod
+    def version(self) -> object:
+        """Token that changes when another process or connection writes"""
+
+    def changes(self, names: Iterable[str]) -> object:
+        """Token that changes when any of the named collections or documents is written
+
+        Engines without per-name tracking fall back to ``version()``.
+        """
+        return self.version()
+
+    def close(self) -> None:
+        pass
+
+    def migrate_json(self, path, collections: dict[str, tuple[str, str | None]] | None = None,
+                     documents: dict[str, str] | None = None, whole: str | None = None) -> bool:
+        """Import a legacy JSON data file once; returns True when it was imported
+
+        ``collections`` maps a list key in the file to (collection, timestamp field),
+        ``documents`` maps a key in the file to a document key, and ``whole``
+        stores the entire file as one document.
+        """
+        path = Path(path)
+        if not path.exists():
+            return False
+        marker = f"migrated:{path.resolve()}"
+        if self.get(marker) is not None:
+            return False
+
+        try:
+            data = read_json(path)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not migrate {path}: {e}")
+            return False
+
+        imported = 0
+        with self.batch():
+            for list_key, (collection, ts_field) in (collections or {}).items():
+                imported += self.append_many(collection, data.get(list_key) or [], ts_field)
+            for file_key, key in (documents or {}).items():
+                if file_key in data:
+                    self.put(key, data[file_key])
+            if whole:
+                self.put(whole, data)
+            self.put(marker, {"records": imported, "size": path.stat().st_size})
+
+        print(f"📦 Migrated {path} into {self.path} ({imported} records)")
+        return True
+
+
+class SQLiteStorage(Storage):
+    """SQLite engine: WAL journal, (collection, ts) index, batched transactions"""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS records (
+            id INTEGER PRIMARY KEY,
+            collection TEXT NOT NULL,
+            ts TEXT,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS records_by_time ON records (collection, ts);
+        CREATE TABLE IF NOT EXISTS documents (
+            key TEXT PRIMARY KEY,
+            data TEXT NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS changes (
+            name TEXT PRIMARY KEY,
+            seq INTEGER NOT NULL
+        ) WITHOUT ROWID;
+        CREATE TRIGGER IF NOT EXISTS records_inserted AFTER INSERT ON records BEGIN
+            INSERT INTO changes (name, seq) VALUES (NEW.collection, 1)
+                ON CONFLICT(name) DO UPDATE SET seq = seq + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS records_updated AFTER UPDATE ON records BEGIN
+            INSERT INTO changes (name, seq) VALUES (NEW.collection, 1)
+                ON CONFLICT(name) DO UPDATE SET seq = seq + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS records_deleted AFTER DELETE ON records BEGIN
+            INSERT INTO changes (name, seq) VALUES (OLD.collection, 1)
+                ON CONFLICT(name) DO UPDATE SET seq = seq + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS documents_inserted AFTER INSERT ON documents BEGIN
+            INSERT INTO changes (name, seq) VALUES (NEW.key, 1)
+                ON CONFLICT(name) DO UPDATE SET seq = seq + 1;
+        END;
+        CREATE TRIGGER IF NOT EXISTS documents_updated AFTER UPDATE ON documents BEGIN
+            INSERT INTO changes (name, seq) VALUES (NEW.key, 1)
+                ON CONFLICT(name) DO UPDATE SET seq = seq + 1;
+        END;
+    """
+
+    INSERT = "INSERT INTO records (collection, ts, data) VALUES (?, ?, ?)"
+    UPDATE = "UPDATE records SET ts = COALESCE(?, ts), data = ? WHERE id = ? AND collection = ?"
+    SELECT = "SELECT data FROM records WHERE collection = ? ORDER BY id"
+    SELECT_SINCE = "SELECT data FROM records WHERE collection = ? AND ts >= ? ORDER BY id"
+    SELECT_PAGE = "SELECT id, data FROM records WHERE +collection = ? AND id > ? ORDER BY id LIMIT ?"
+    PAGE_SIZE = 2000
+    # Unary + keeps the planner on a backwards rowid scan, which stops at the newest match
+    LAST = "SELECT id, data FROM records WHERE +collection = ? ORDER BY id DESC LIMIT 1"
+    COUNT = "SELECT count(*) FROM records WHERE collection = ?"
+    GET = "SELECT data FROM documents WHERE key = ?"
+    PUT = "INSERT INTO documents (key, data) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET data = excluded.data"
+
+    def __init__(self, path):
+        import sqlite3  # deferred: keeps tool startup free of the sqlite3 extension
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit outside batch(); one connection shared across threads under a lock
+        self.conn = sqlite3.connect(str(self.path), isolation_level=None, check_same_thread=False,
+                                    timeout=30, cached_statements=64)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(self.SCHEMA)
+        self._lock = threading.RLock()
+        self._depth = 0
+
+    @contextlib.contextmanager
+    def batch(self):
+        with self._lock:
+            outer = self._depth == 0
+            if outer:
+                self.conn.execute("BEGIN IMMEDIATE")
+            self._depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._depth -= 1
+                if outer:
+                    self.conn.execute("ROLLBACK")
+                raise
+            self._depth -= 1
+            if outer:
+                self.conn.execute("COMMIT")
+
+    def append(self, collection: str, record: dict, ts: str | None = None) -> int:
+        with self._lock:
+            return self.conn.execute(self.INSERT, (collection, ts, _dumps(record))).lastrowid
+
+    def append_many(self, collection: str, records: Iterable[dict], ts_field: str | None = None) -> int:
+        rows = [(collection, r.get(ts_field) if ts_field else None, _dumps(r)) for r in records]
+        with self.batch():
+            self.conn.executemany(self.INSERT, rows)
+        return len(rows)
+
+    def update(self, collection: str, record_id: int, record: dict, ts: str | None = None) -> None:
+        with self._lock:
+            self.conn.execute(self.UPDATE, (ts, _dumps(record), record_id, collection))
+
+    def records(self, collection: str, since: str | None = None) -> list[dict]:
+        with self._lock:
+            if since is None:
+                rows = self.conn.execute(self.SELECT, (collection,))
+            else:
+                rows = self.conn.execute(self.SELECT_SINCE, (collection, since))
+            return [json.loads(data) for (data,) in rows]
+
+    def iter_records(self, collection: str) -> Iterable[dict]:
+        # Keyset pages keep the lock only per page, so other threads can write in between
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self.conn.execute(self.SELECT_PAGE, (collection, last_id, self.PAGE_SIZE)).fetchall()
+            for record_id, data in rows:
+                yield json.loads(data)
+            if len(rows) < self.PAGE_SIZE:
+                return
+            last_id = rows[-1][0]
+
+    def last(self, collection: str) -> tuple[int, dict] | None:
+        with self._lock:
+            row = self.conn.execute(self.LAST, (collection,)).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return self.conn.execute(self.COUNT, (collection,)).fetchone()[0]
+
+    def get(self, key: str, default: object = None) -> object:
+        with self._lock:
+            row = self.conn.execute(self.GET, (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def put(self, key: str, value: object) -> None:
+        with self._lock:
+            self.conn.execute(self.PUT, (key, _dumps(value)))
+
+    def version(self) -> object:
+        with self._lock:
+            return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changes(self, names: Iterable[str]) -> object:
+        # Counters are bumped by triggers in the writing transaction, so every
+        # connection (and process) sees the same values
+        names = sorted(set(names))
+        query = f"SELECT name, seq FROM changes WHERE name IN ({', '.join('?' * len(names))})"
+        with self._lock:
+            return sorted(self.conn.execute(query, names).fetchall())
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+class JSONStorage(Storage):
+    """Whole-file JSON engine: every write outside batch() rewrites the file"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._dirty = False
+        if self.path.exists() and self.path.stat().st_size:
+            self.state = read_json(self.path)
+        else:
+            self.state = {"records": {}, "documents": {}, "next_id": 1}
+
+    def _write(self) -> None:
+        if self._depth:
+            self._dirty = True
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_file, "w") as f:
+            f.write(_dumps(self.state))
+        tmp_file.replace(self.path)
+        self._dirty = False
+
+    @contextlib.contextmanager
+    def batch(self):
+        with self._lock:
+            self._depth += 1
+            try:
+                yield self
+            finally:
+                self._depth -= 1
+            if not self._depth and self._dirty:
+                self._write()
+
+    def _append(self, collection: str, record: dict, ts: str | None) -> int:
+        record_id = self.state["next_id"]
+        self.state["next_id"] += 1
+        self.state["records"].setdefault(collection, []).append([record_id, ts, record])
+        return record_id
+
+    def append(self, collection: str, record: dict, ts: str | None = None) -> int:
+        with self._lock:
+            record_id = self._append(collection, record, ts)
+            self._write()
+            return record_id
+
+    def append_many(self, collection: str, records: Iterable[dict], ts_field: str | None = None) -> int:
+        count = 0
+        with self.batch():
+            for record in records:
+                self._append(collection, record, record.get(ts_field) if ts_field else None)
+                count += 1
+            self._dirty = True
+        return count
+
+    def update(self, collection: str, record_id: int, record: dict, ts: str | None = None) -> None:
+        with self._lock:
+            for row in reversed(self.state["records"].get(collection, [])):
+                if row[0] == record_id:
+                    row[1] = ts if ts is not None else row[1]
+                    row[2] = record
+                    break
+            self._write()
+
+    def records(self, collection: str, since: str | None = None) -> list[dict]:
+        with self._lock:
+            rows = self.state["records"].get(collection, [])
+            if since is None:
+                return [row[2] for row in rows]
+            return [row[2] for row in rows if row[1] is not None and row[1] >= since]
+
+    def last(self, collection: str) -> tuple[int, dict] | None:
+        with self._lock:
+            rows = self.state["records"].get(collection)
+            return (rows[-1][0], rows[-1][2]) if rows else None
+
+    def count(self, collection: str) -> int:
+        with self._lock:
+            return len(self.state["records"].get(collection, []))
+
+    def get(self, key: str, default: object = None) -> object:
+        with self._lock:
+            return self.state["documents"].get(key, default)
+
+    def put(self, key: str, value: object) -> None:
+        with self._lock:
+            self.state["documents"][key] = value
+            self._write()
+
+    def version(self) -> object:
+        try:
+            return self.path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+class DocumentMap(MutableMapping):
+    """Dict-like view over one document per key, loading each value on first access
+
+    The document ``name`` holds the key list and every value lives in
+    ``name:key``, so a large map is never parsed as a whole: opening it reads
+    the key list, and each lookup reads one entry. Writes go straight to
+    storage; values mutated in place are written back by ``flush()``. A map
+    stored whole under ``name`` (e.g. by ``migrate_json(whole=...)``) is
+    split into per-key documents once, on first open.
+    """
+
+    def __init__(self, storage: Storage, name: str):
+        self.storage = storage
+        self.name = name
+        self._values: dict = {}
+        index = storage.get(name)
+        if isinstance(index, dict):
+            with storage.batch():
+                for key, value in index.items():
+                    storage.put(self._document(key), value)
+                storage.put(name, list(index))
+            self._values = dict(index)
+            index = list(index)
+        self._keys = dict.fromkeys(index or [])  # ordered set
+
+    def _document(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def __getitem__(self, key: str) -> object:
+        if key not in self._keys:
+            raise KeyError(key)
+        if key not in self._values:
+            self._values[key] = self.storage.get(self._document(key))
+        return self._values[key]
+
+    def __setitem__(self, key: str, value: object) -> None:
+        with self.storage.batch():
+            self.storage.put(self._document(key), value)
+            self._keys[key] = None
+            self.storage.put(self.name, list(self._keys))  # the index doubles as the change marker
+        self._values[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._keys[key]
+        self._values.pop(key, None)
+        with self.storage.batch():
+            self.storage.put(self._document(key), None)
+            self.storage.put(self.name, list(self._keys))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._keys))
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def replace(self, mapping: dict) -> None:
+        """Make the stored map equal to ``mapping`` in one transaction"""
+        with self.storage.batch():
+            for key in [k for k in self._keys if k not in mapping]:
+                del self[key]
+            for key, value in mapping.items():
+                self[key] = value
+
+    def flush(self) -> None:
+        """Write back every value loaded so far (catches in-place mutations)"""
+        with self.storage.batch():
+            for key, value in self._values.items():
+                self.storage.put(self._document(key), value)
+            self.storage.put(self.name, list(self._keys))
+
+
+ENGINES = {
+    "sqlite": SQLiteStorage,
+    "json": JSONStorage,
+}
+
+DEFAULT_FILES = {
+    "sqlite": "openclaw.db",
+    "json": "openclaw.json",
+}
+
+
+def open_storage(path=None, engine: str | None = None) -> Storage:
+    """Open the configured storage engine (see OPENCLAW_STORAGE / OPENCLAW_DB)"""
+    engine = engine or os.environ.get("OPENCLAW_STORAGE") or "sqlite"
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown storage engine: {engine} (choose from {', '.join(ENGINES)})")
+    path = path or os.environ.get("OPENCLAW_DB") or Path.home() / ".openclaw" / DEFAULT_FILES[engine]
+    return ENGINES[engine](path)
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Tool Registry
+Loads the hyphen-named tool scripts as modules so other tools can reuse their classes
+**Created**: 2026-10-19
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+TOOLS_DIR = Path(__file__).resolve().parent
+
+# tool name -> (script file, main class)
+TOOLS = {
+    "tracker": ("productivity-tracker.py", "ProductivityTracker"),
+    "broadcaster": ("community-broadcast-automator.py", "RealCommunityBroadcaster"),
+    "leads": ("lead-generation-automation.py", "RealLeadGenerationSystem"),
+    "competitors": ("competitor-monitoring.py", "CompetitorMonitor"),
+    "status": ("project-status-reporter.py", "ProjectStatusReporter"),
+}
+
+
+def load_tool(name: str):
+    """Import a tool script by registry name and return its module (cached in sys.modules)"""
+    if name not in TOOLS:
+        raise KeyError(f"Unknown tool: {name} (available: {', '.join(TOOLS)})")
+
+    module_name = f"openclaw_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    if str(TOOLS_DIR) not in sys.path:
+        sys.path.insert(0, str(TOOLS_DIR))
+
+    spec = importlib.util.spec_from_file_location(module_name, TOOLS_DIR / TOOLS[name][0])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def tool_class(name: str):
+    """Return the main class of a tool"""
+    return getattr(load_tool(name), TOOLS[name][1])
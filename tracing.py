@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+OpenClaw Tracing
+Lightweight timing spans with Chrome/Perfetto trace export and optional profilers
+**Created**: 2026-10-19
+
+Spans are disabled unless ``OPENCLAW_TRACE`` names an output file (or
+``enable()`` is called); a disabled ``span()`` returns a shared no-op
+context manager, so instrumented hot paths pay one global lookup.
+
+    OPENCLAW_TRACE=/tmp/trace.json          write spans as Chrome trace events
+    OPENCLAW_PROFILE=cprofile               also dump cProfile stats (<trace>.prof)
+    OPENCLAW_PROFILE=tracemalloc            also record top allocations (<trace>.mem.txt)
+
+Tools also accept ``--trace FILE`` and ``--profile MODE`` on the command line.
+
+Open the trace file in https://ui.perfetto.dev or chrome://tracing.
+"""
+
+from __future__ import annotations
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+
+_enabled = False
+_events = []
+_lock = threading.Lock()
+_trace_file: str | None = None
+_profile_mode: str | None = None
+_profiler = None
+_pid = os.getpid()
+
+
+class _NoopSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+class _Span:
+    __slots__ = ("name", "category", "args", "start")
+
+    def __init__(self, name: str, category: str, args: dict):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        event = {
+            "name": self.name,
+            "cat": self.category,
+            "ph": "X",
+            "ts": self.start / 1000,
+            "dur": (end - self.start) / 1000,
+            "pid": _pid,
+            "tid": threading.get_ident()
+        }
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+        return False
+
+    def set(self, **args):
+        """Attach extra arguments to the span (shown in the trace viewer)"""
+        self.args.update(args)
+
+
+def span(name: str, category: str = "openclaw", **args):
+    """Context manager timing a block; a shared no-op when tracing is disabled"""
+    if not _enabled:
+        return _NOOP
+    return _Span(name, category, args)
+
+
+def traced(name: str | None = None, category: str = "openclaw"):
+    """Decorator form of ``span`` using the function's qualified name by default"""
+    def decorator(func):
+        label = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Span(label, category, {}):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable(trace_file: str | None = None, profile: str | None = None) -> None:
+    """Turn tracing on, writing the trace (and profiler output) at interpreter exit"""
+    global _enabled, _trace_file, _profile_mode, _profiler
+    if _enabled:
+        return
+    _enabled = True
+    _trace_file = trace_file or "openclaw-trace.json"
+    _profile_mode = profile
+
+    if profile == "cprofile":
+        import cProfile
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+    elif profile == "tracemalloc":
+        import tracemalloc
+        tracemalloc.start(25)
+
+    atexit.register(write_trace)
+
+
+def init_from_argv(argv: list) -> list:
+    """Handle ``--trace FILE`` and ``--profile cprofile|tracemalloc`` flags, removing them from argv"""
+    trace_file = profile = None
+    for flag in ("--trace", "--profile"):
+        if flag in argv:
+            i = argv.index(flag)
+            value = argv[i + 1] if i + 1 < len(argv) else None
+            del argv[i:i + 2]
+            if flag == "--trace":
+                trace_file = value
+            else:
+                profile = value
+    if trace_file or profile:
+        enable(trace_file, profile)
+    return argv
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def events() -> list:
+    with _lock:
+        return list(_events)
+
+
+def write_trace(path: str | None = None) -> str | None:
+    """Write collected spans as a Chrome trace JSON file; returns the path written"""
+    path = path or _trace_file
+    if not path:
+        return None
+
+    with _lock:
+        trace = {
+            "traceEvents": [
+                {"name": "process_name", "ph": "M", "pid": _pid, "args": {"name": "openclaw"}},
+                *_events
+            ],
+            "displayTimeUnit": "ms"
+        }
+    with open(path, "w") as f:
+        json.dump(trace, f)
+
+    if _profile_mode == "cprofile" and _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(f"{path}.prof")
+    elif _profile_mode == "tracemalloc":
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            with open(f"{path}.mem.txt", "w") as f:
+                for stat in snapshot.statistics("lineno")[:50]:
+                    f.write(f"{stat}\n")
+    return path
+
+
+if os.environ.get("OPENCLAW_TRACE"):
+    enable(os.environ["OPENCLAW_TRACE"], os.environ.get("OPENCLAW_PROFILE") or None)
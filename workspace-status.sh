@@ -2,35 +2,16 @@
 
 # Workspace Status Checker
 # Shows overview of all projects
+# Repo status comes from workspace_scanner.py (parallel, cached git status)
+
+TOOLS_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 echo "📊 WORKSPACE STATUS OVERVIEW"
 echo "============================"
 echo ""
 
-echo "🗂️  Brands Directory:"
-for dir in /home/node/.openclaw/workspace/brands/*/; do
-    if [ -d "$dir/.git" ]; then
-        name=$(basename "$dir")
-        commits=$(cd "$dir" && git rev-list --count HEAD 2>/dev/null || echo "0")
-        echo "  ✓ $name ($commits commits)"
-    fi
-done
-
-echo ""
-echo "📁 Projects Directory:"
-for dir in /home/node/.openclaw/workspace/projects/*/; do
-    if [ -d "$dir" ]; then
-        name=$(basename "$dir")
-        if [ -d "$dir/.git" ]; then
-            commits=$(cd "$dir" && git rev-list --count HEAD 2>/dev/null || echo "0")
-            echo "  ✓ $name ($commits commits)"
-        else
-            echo "  ○ $name (no git)"
-        fi
-    fi
-done
+python3 "$TOOLS_DIR/workspace_scanner.py" "$@"
 
-echo ""
 echo "🔧 Tools Available:"
 ls -1 /home/node/.openclaw/workspace/tools/*.sh 2>/dev/null | while read tool; do
     name=$(basename "$tool")
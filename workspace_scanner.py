@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Workspace Scanner
+Parallel, cached git status for every repository under brands/ and projects/
+**Created**: 2026-10-19
+
+For each repo the scanner reports commit count, dirty state and ahead/behind
+counts against the upstream branch. Results are cached per repo and keyed by
+the HEAD ref, the tips of the branch and its remote-tracking ref, and the
+packed-refs, config, index and top-level directory mtimes, so a repo that
+hasn't changed since the last scan costs a handful of stat calls instead of
+git forks.
+
+Edits to existing files below the top level don't touch any of those, so a
+cached dirty flag can lag behind them. Cached results (dirty state and
+ahead/behind counts) are marked with ``cached`` and ``scanned_at``;
+``--refresh`` rescans all repos.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+WORKSPACE = "/home/node/.openclaw/workspace"
+SCAN_DIRS = ("brands", "projects")
+
+
+def _git(repo: Path, *args: str) -> Optional[str]:
+    result = subprocess.run(["git", "-C", str(repo), *args], capture_output=True, text=True)
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _read_ref(git_dir: Path, ref: str) -> Optional[str]:
+    try:
+        return (git_dir / ref).read_text().strip()
+    except OSError:
+        return None  # ref only lives in packed-refs; its mtime covers it
+
+
+def upstream_ref(git_dir: Path, branch: str) -> Optional[str]:
+    """Remote-tracking ref of ``branch`` from ``branch.<name>.remote/merge`` in .git/config"""
+    try:
+        lines = (git_dir / "config").read_text().splitlines()
+    except OSError:
+        return None
+    section = f'[branch "{branch}"]'
+    values, inside = {}, False
+    for line in lines:
+        line = line.strip()
+        if line.startswith("["):
+            inside = line == section
+        elif inside and "=" in line:
+            name, value = line.split("=", 1)
+            values[name.strip().lower()] = value.strip().strip('"')
+    remote, merge = values.get("remote"), values.get("merge")
+    if not remote or not merge or not merge.startswith("refs/heads/"):
+        return None
+    if remote == ".":
+        return merge  # tracks a local branch
+    return f"refs/remotes/{remote}/{merge[len('refs/heads/'):]}"
+
+
+def repo_state_key(repo: Path) -> Optional[list]:
+    """Cheap cache key for a repo: HEAD, its tip and its upstream's tip, plus ref, index and directory mtimes"""
+    git_dir = repo / ".git"
+    try:
+        head = (git_dir / "HEAD").read_text().strip()
+    except OSError:
+        return None
+
+    ref_tip = upstream_tip = None
+    if head.startswith("ref: "):
+        ref_tip = _read_ref(git_dir, head[5:])
+        upstream = upstream_ref(git_dir, head[5:].split("refs/heads/", 1)[-1])
+        if upstream:
+            # git push only moves the remote-tracking ref
+            upstream_tip = [upstream, _read_ref(git_dir, upstream)]
+
+    # Upstream tips also move on fetch, which touches FETCH_HEAD; config changes
+    # when an upstream is set, and the repo dir's own mtime catches files
+    # created, removed or renamed at the top level
+    return [head, ref_tip, upstream_tip, _mtime(git_dir / "packed-refs"), _mtime(git_dir / "index"),
+            _mtime(git_dir / "FETCH_HEAD"), _mtime(git_dir / "config"), _mtime(repo)]
+
+
+class WorkspaceScanner:
+    """Scan workspace repositories concurrently with a per-repo result cache"""
+
+    def __init__(self, workspace: str = WORKSPACE, cache_file: Optional[Path] = None,
+                 max_workers: Optional[int] = None):
+        self.workspace = Path(workspace)
+        self.cache_file = Path(cache_file) if cache_file else Path.home() / ".openclaw" / "workspace_scan.json"
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.cache = self._load_cache()
+        self.stats = {"scanned": 0, "cached": 0}
+        self._lock = threading.Lock()  # stats and cache are updated from pool threads
+
+    def _load_cache(self) -> dict:
+        if self.cache_file.exists():
+            try:
+                with open(self.cache_file, "r") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(self.cache, f)
+            tmp_file.replace(self.cache_file)
+        except OSError as e:
+            print(f"Warning: Could not save workspace scan cache: {e}")
+
+    def discover(self) -> Dict[str, List[Path]]:
+        """List project directories per scan root, sorted by name"""
+        found = {}
+        for root in SCAN_DIRS:
+            try:
+                entries = sorted(os.scandir(self.workspace / root), key=lambda e: e.name)
+            except OSError:
+                entries = []
+            found[root] = [Path(e.path) for e in entries if e.is_dir()]
+        return found
+
+    def inspect_repo(self, repo: Path) -> dict:
+        """Collect git status for one repo with git subprocesses"""
+        count = _git(repo, "rev-list", "--count", "HEAD")
+        porcelain = _git(repo, "status", "--porcelain", "--untracked-files=normal")
+        upstream = _git(repo, "rev-list", "--left-right", "--count", "HEAD...@{upstream}")
+
+        ahead = behind = None
+        if upstream:
+            ahead, behind = (int(n) for n in upstream.split())
+
+        return {
+            "name": repo.name,
+            "path": str(repo),
+            "git": True,
+            "commits": int(count) if count else 0,
+            "dirty": bool(porcelain),
+            "changed_files": len(porcelain.splitlines()) if porcelain else 0,
+            "branch": _git(repo, "rev-parse", "--abbrev-ref", "HEAD"),
+            "has_upstream": upstream is not None,
+            "ahead": ahead,
+            "behind": behind,
+            "scanned_at": time.time()
+        }
+
+    def _scan_one(self, repo: Path) -> dict:
+        key = repo_state_key(repo)
+        if key is None:
+            return {"name": repo.name, "path": str(repo), "git": False}
+
+        with self._lock:
+            cached = self.cache.get(str(repo))
+            if cached and cached["key"] == key:
+                self.stats["cached"] += 1
+                return dict(cached["status"], cached=True)
+
+        status = self.inspect_repo(repo)
+        with self._lock:
+            self.cache[str(repo)] = {"key": key, "status": status}
+            self.stats["scanned"] += 1
+        return dict(status, cached=False)
+
+    def scan(self, refresh: bool = False) -> Dict[str, List[dict]]:
+        """Status of every project directory, grouped by scan root"""
+        from concurrent.futures import ThreadPoolExecutor  # deferred: keeps importers' startup light
+
+        if refresh:
+            self.cache = {}
+        found = self.discover()
+        repos = [repo for paths in found.values() for repo in paths]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            statuses = dict(zip(repos, pool.map(self._scan_one, repos)))
+
+        # Forget repos that no longer exist so the cache doesn't grow forever
+        live = {str(repo) for repo in repos}
+        for path in list(self.cache):
+            if path not in live:
+                del self.cache[path]
+        self._save_cache()
+
+        return {root: [statuses[repo] for repo in paths] for root, paths in found.items()}
+
+    def pending_pushes(self) -> List[dict]:
+        """Repos with local commits not yet on their upstream (or no upstream at all)"""
+        pending = []
+        for repos in self.scan().values():
+            for repo in repos:
+                if not repo.get("git") or not repo["commits"]:
+                    continue
+                if repo["has_upstream"] and not repo["ahead"]:
+                    continue
+                pending.append(repo)
+        return pending
+
+
+def print_overview(scanner: WorkspaceScanner, refresh: bool = False) -> None:
+    """Workspace overview in the format of workspace-status.sh"""
+    results = scanner.scan(refresh)
+    titles = {"brands": "🗂️  Brands Directory:", "projects": "📁 Projects Directory:"}
+
+    for root in SCAN_DIRS:
+        print(titles[root])
+        for repo in results[root]:
+            if not repo.get("git"):
+                if root == "projects":
+                    print(f"  ○ {repo['name']} (no git)")
+                continue
+            extras = []
+            if repo["dirty"]:
+                extras.append(f"{repo['changed_files']} changed")
+            if repo["ahead"]:
+                extras.append(f"↑{repo['ahead']}")
+            if repo["behind"]:
+                extras.append(f"↓{repo['behind']}")
+            if not repo["has_upstream"]:
+                extras.append("no upstream")
+            suffix = f" [{', '.join(extras)}]" if extras else ""
+            print(f"  ✓ {repo['name']} ({repo['commits']} commits){suffix}")
+        print("")
+
+    if scanner.stats["cached"]:
+        print(f"ℹ️  {scanner.stats['cached']} repos unchanged since their last scan; "
+              f"changed-file and ahead/behind counts are from that scan (--refresh to rescan)")
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    scanner = WorkspaceScanner(args[0] if args else WORKSPACE)
+    refresh = "--refresh" in sys.argv
+    if "--json" in sys.argv:
+        print(json.dumps(scanner.scan(refresh), indent=2))
+    else:
+        print_overview(scanner, refresh)